@@ -7,271 +7,525 @@ Gera gráficos e tabelas para análise dos resultados
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # geração apenas em arquivo, sem backend interativo
 import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from cycler import cycler
+from scipy.stats import gaussian_kde
 from pathlib import Path
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+import os
 import warnings
 warnings.filterwarnings('ignore')
 
-# Configuração do estilo
-plt.style.use('seaborn-v0_8-darkgrid' if 'seaborn-v0_8-darkgrid' in plt.style.available else 'seaborn-darkgrid')
-sns.set_palette("husl")
-plt.rcParams['figure.figsize'] = (12, 6)
-plt.rcParams['font.size'] = 10
+try:
+    from numba import njit, prange
+except ImportError:  # numba é opcional
+    njit = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:  # pyarrow é opcional; sem ele, leitura em blocos com o engine C e sem cache Parquet
+    HAS_PYARROW = False
+
+CSV_ENGINE = 'pyarrow' if HAS_PYARROW else 'c'
+
+# Chave, nos metadados do cache Parquet, da identificação do CSV de origem
+# (caminho resolvido, tamanho e st_mtime_ns); o cache só é usado se ela coincidir
+CACHE_SOURCE_KEY = b'dashboard_csv_source'
+# Versão do conteúdo do cache; incrementar quando _read_csv mudar colunas ou tipos
+CACHE_VERSION = 2
+
+
+def _setup_plot_style():
+    """Estilo dos gráficos, aplicado no processo principal e em cada processo do pool"""
+    plt.style.use('seaborn-v0_8-darkgrid' if 'seaborn-v0_8-darkgrid' in plt.style.available else 'seaborn-darkgrid')
+    # Paleta "husl" do seaborn (6 cores), fixada para não importar o seaborn
+    plt.rcParams['axes.prop_cycle'] = cycler(color=['#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4'])
+    plt.rcParams['figure.figsize'] = (12, 6)
+    plt.rcParams['font.size'] = 10
+    # Simplifica caminhos densos (pontos sub-pixel) antes da rasterização
+    plt.rcParams['path.simplify'] = True
+    plt.rcParams['path.simplify_threshold'] = 1.0
+    plt.rcParams['agg.path.chunksize'] = 10000
+
+
+_setup_plot_style()
+
+# Tipos compactos para as colunas usadas pelo dashboard
+CSV_DTYPES = {
+    'api_type': 'category',
+    'query_type': 'category',
+    'success': 'bool',
+}
+
+# Linhas por bloco na leitura do CSV com o engine C (o engine pyarrow lê tudo de uma vez)
+CSV_CHUNKSIZE = 200_000
+
+# A partir deste número de medições, média/desvio usam o kernel numba (se disponível)
+NUMBA_MIN_ROWS = 1_000_000
+
+if njit is not None:
+    # Sem 'nnan' nas flags de fastmath: o kernel precisa detectar NaN
+    @njit(parallel=True, fastmath={'reassoc', 'contract'}, cache=True)
+    def _mean_std(x):
+        """
+        Média e desvio padrão amostral (ddof=1) ignorando NaN, em duas passadas
+        
+        A variância soma os desvios em relação à média já calculada: s2 - n*média²
+        (uma passada) cancela catastroficamente justamente nos arrays grandes.
+        """
+        s = 0.0
+        n = 0
+        for i in prange(x.shape[0]):
+            v = x[i]
+            if not np.isnan(v):
+                s += v
+                n += 1
+        if n == 0:
+            return np.nan, np.nan
+        mean = s / n
+        if n == 1:
+            return mean, np.nan
+        
+        ss = 0.0
+        for i in prange(x.shape[0]):
+            v = x[i]
+            if not np.isnan(v):
+                d = v - mean
+                ss += d * d
+        return mean, np.sqrt(ss / (n - 1))
+else:
+    _mean_std = None
+
+# Pontos da grade em que a KDE de cada violino é avaliada
+VIOLIN_GRID_POINTS = 200
+
+# Acima deste número de pontos por série, o scatter é reduzido via LTTB
+SCATTER_MAX_POINTS = 5000
+SCATTER_TARGET_POINTS = 3000
+
+
+def lttb_downsample(x: np.ndarray, y: np.ndarray, n_out: int = SCATTER_TARGET_POINTS):
+    """
+    Reduz uma série (x, y) a n_out pontos com Largest-Triangle-Three-Buckets
+    
+    Os pontos são ordenados por x; o primeiro e o último são sempre mantidos e,
+    em cada bucket intermediário, fica o ponto que forma o maior triângulo com o
+    ponto escolhido anteriormente e a média do bucket seguinte.
+    
+    Returns:
+        Tuple: (x_reduzido, y_reduzido)
+    """
+    finite = np.isfinite(x) & np.isfinite(y)
+    x, y = x[finite], y[finite]
+    n = len(x)
+    if n_out < 3 or n <= n_out:
+        return x, y
+    
+    order = np.argsort(x, kind='stable')
+    x, y = x[order], y[order]
+    
+    # n_out - 2 buckets cobrindo os pontos entre o primeiro e o último
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    
+    return x[selected], y[selected]
+
+
+def _render(plot):
+    """Executa uma função de plotagem (parcial) em um processo do pool"""
+    plot()
+
+
+def _plot_violins(ax, arrays, colors, labels=('GraphQL', 'REST')):
+    """Desenha violinos a partir de uma KDE avaliada uma única vez em grade fixa"""
+    for pos, (values, color) in enumerate(zip(arrays, colors)):
+        if len(values) < 2 or np.ptp(values) == 0:
+            continue
+        
+        grid = np.linspace(values.min(), values.max(), VIOLIN_GRID_POINTS)
+        density = gaussian_kde(values)(grid)
+        half_width = density / density.max() * 0.4
+        
+        ax.fill_betweenx(grid, pos - half_width, pos + half_width,
+                         facecolor=color, edgecolor='black', alpha=0.8)
+        ax.hlines(np.median(values), pos - 0.1, pos + 0.1, color='white', linewidth=2)
+    
+    ax.set_xticks(range(len(arrays)))
+    ax.set_xticklabels(labels)
+
+
+def _plot_distribution(data_to_plot, colors, ylabel, box_title, violin_title, out_path, dpi):
+    """Boxplot e violinos de uma métrica, GraphQL vs REST (gráficos 1 e 2)"""
+    fig = Figure(figsize=(14, 6))
+    FigureCanvasAgg(fig)
+    axes = fig.subplots(1, 2)
+    
+    # Boxplot
+    bp = axes[0].boxplot(data_to_plot, labels=['GraphQL', 'REST'], patch_artist=True)
+    bp['boxes'][0].set_facecolor(colors[0])
+    bp['boxes'][1].set_facecolor(colors[1])
+    axes[0].set_ylabel(ylabel, fontsize=12)
+    axes[0].set_title(box_title, fontsize=14, fontweight='bold')
+    axes[0].grid(True, alpha=0.3)
+    
+    # Violin plot
+    _plot_violins(axes[1], data_to_plot, colors)
+    axes[1].set_xlabel('Tipo de API', fontsize=12)
+    axes[1].set_ylabel(ylabel, fontsize=12)
+    axes[1].set_title(violin_title, fontsize=14, fontweight='bold')
+    axes[1].grid(True, alpha=0.3)
+    
+    # Margens fixas: evita o ajuste iterativo de tight_layout/bbox_inches
+    fig.subplots_adjust(left=0.06, right=0.98, top=0.88, bottom=0.1, wspace=0.2)
+    fig.savefig(out_path, dpi=dpi)
+    print(f"Gráfico salvo: {out_path.name}")
+
+
+def _plot_by_query_type(grouped_time, grouped_size, means, out_path):
+    """
+    Comparação por tipo de consulta (gráfico 3)
+    
+    Args:
+        grouped_time: (api_type, query_type) -> tempos (ms)
+        grouped_size: (api_type, query_type) -> tamanhos (KB)
+        means: Médias de tempo e tamanho por query_type, com api_type nas colunas
+    """
+    fig = Figure(figsize=(16, 12))
+    FigureCanvasAgg(fig)
+    axes = fig.subplots(2, 2)
+    
+    query_types = ['simple', 'complex', 'multiple']
+    query_labels = ['Simples', 'Complexa', 'Múltiplos Recursos']
+    
+    # Tempo por tipo de consulta
+    empty = np.array([])
+    time_data = [
+        [grouped_time.get(('graphql', qt), empty), grouped_time.get(('rest', qt), empty)]
+        for qt in query_types
+    ]
+    
+    # Boxplot de tempo por tipo (GraphQL à esquerda e REST à direita de cada posição)
+    positions = [1, 2, 3]
+    width = 0.6
+    all_positions = [p + offset for p in positions for offset in (-width/2, width/2)]
+    
+    bp = axes[0, 0].boxplot([d for pair in time_data for d in pair], positions=all_positions,
+                            widths=width/2, patch_artist=True)
+    for box, color in zip(bp['boxes'], ['#3498db', '#e74c3c'] * len(query_types)):
+        box.set_facecolor(color)
+    
+    axes[0, 0].set_xticks(positions)
+    axes[0, 0].set_xticklabels(query_labels)
+    axes[0, 0].set_ylabel('Tempo de Resposta (ms)', fontsize=12)
+    axes[0, 0].set_title('Tempo de Resposta por Tipo de Consulta', fontsize=14, fontweight='bold')
+    axes[0, 0].grid(True, alpha=0.3)
+    
+    # Tamanho por tipo de consulta
+    size_data = [
+        [grouped_size.get(('graphql', qt), empty), grouped_size.get(('rest', qt), empty)]
+        for qt in query_types
+    ]
+    
+    bp = axes[0, 1].boxplot([d for pair in size_data for d in pair], positions=all_positions,
+                            widths=width/2, patch_artist=True)
+    for box, color in zip(bp['boxes'], ['#2ecc71', '#f39c12'] * len(query_types)):
+        box.set_facecolor(color)
+    
+    axes[0, 1].set_xticks(positions)
+    axes[0, 1].set_xticklabels(query_labels)
+    axes[0, 1].set_ylabel('Tamanho da Resposta (KB)', fontsize=12)
+    axes[0, 1].set_title('Tamanho da Resposta por Tipo de Consulta', fontsize=14, fontweight='bold')
+    axes[0, 1].grid(True, alpha=0.3)
+    
+    # Médias de tempo
+    time_means = means['response_time_ms'].reindex(index=query_types, columns=['graphql', 'rest'])
+    
+    x = np.arange(len(query_labels))
+    width = 0.35
+    graphql_means = time_means['graphql'].tolist()
+    rest_means = time_means['rest'].tolist()
+    
+    axes[1, 0].bar(x - width/2, graphql_means, width, label='GraphQL', color='#3498db')
+    axes[1, 0].bar(x + width/2, rest_means, width, label='REST', color='#e74c3c')
+    axes[1, 0].set_xlabel('Tipo de Consulta', fontsize=12)
+    axes[1, 0].set_ylabel('Tempo Médio (ms)', fontsize=12)
+    axes[1, 0].set_title('Tempo Médio de Resposta por Tipo', fontsize=14, fontweight='bold')
+    axes[1, 0].set_xticks(x)
+    axes[1, 0].set_xticklabels(query_labels)
+    axes[1, 0].legend()
+    axes[1, 0].grid(True, alpha=0.3, axis='y')
+    
+    # Médias de tamanho
+    size_means = means['response_size_kb'].reindex(index=query_types, columns=['graphql', 'rest'])
+    
+    graphql_size_means = size_means['graphql'].tolist()
+    rest_size_means = size_means['rest'].tolist()
+    
+    axes[1, 1].bar(x - width/2, graphql_size_means, width, label='GraphQL', color='#2ecc71')
+    axes[1, 1].bar(x + width/2, rest_size_means, width, label='REST', color='#f39c12')
+    axes[1, 1].set_xlabel('Tipo de Consulta', fontsize=12)
+    axes[1, 1].set_ylabel('Tamanho Médio (KB)', fontsize=12)
+    axes[1, 1].set_title('Tamanho Médio da Resposta por Tipo', fontsize=14, fontweight='bold')
+    axes[1, 1].set_xticks(x)
+    axes[1, 1].set_xticklabels(query_labels)
+    axes[1, 1].legend()
+    axes[1, 1].grid(True, alpha=0.3, axis='y')
+    
+    # Margens fixas: evita o ajuste iterativo de tight_layout/bbox_inches
+    fig.subplots_adjust(left=0.06, right=0.98, top=0.95, bottom=0.06, wspace=0.2, hspace=0.25)
+    # Sem scatter: vetorial (SVG) evita a rasterização
+    fig.savefig(out_path, format='svg')
+    print(f"Gráfico salvo: {out_path.name}")
+
+
+def _plot_scatter(series, out_path, dpi):
+    """
+    Tempo vs tamanho e histograma de tempo (gráfico 4)
+    
+    Args:
+        series: ((tempos, tamanhos) do GraphQL, (tempos, tamanhos) do REST), em ms e KB
+    """
+    fig = Figure(figsize=(16, 6))
+    FigureCanvasAgg(fig)
+    axes = fig.subplots(1, 2)
+    
+    # Scatter plot - Tempo vs Tamanho (séries grandes são reduzidas via LTTB)
+    scatter_points = []
+    for x, y in series:
+        if len(x) > SCATTER_MAX_POINTS:
+            x, y = lttb_downsample(x, y, SCATTER_TARGET_POINTS)
+        scatter_points.append((x, y))
+    
+    axes[0].scatter(*scatter_points[0], alpha=0.5, label='GraphQL', color='#3498db', s=30)
+    axes[0].scatter(*scatter_points[1], alpha=0.5, label='REST', color='#e74c3c', s=30)
+    axes[0].set_xlabel('Tempo de Resposta (ms)', fontsize=12)
+    axes[0].set_ylabel('Tamanho da Resposta (KB)', fontsize=12)
+    axes[0].set_title('Relação entre Tempo e Tamanho da Resposta', fontsize=14, fontweight='bold')
+    axes[0].legend()
+    axes[0].grid(True, alpha=0.3)
+    
+    # Histograma comparativo - Tempo (bins compartilhados entre as duas séries)
+    edges = np.histogram_bin_edges(np.concatenate([times for times, _ in series]), bins=50)
+    for (times, _), label, color in zip(series, ('GraphQL', 'REST'), ('#3498db', '#e74c3c')):
+        counts, _ = np.histogram(times, bins=edges)
+        axes[1].bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.6,
+                    label=label, color=color, edgecolor='black')
+    axes[1].set_xlabel('Tempo de Resposta (ms)', fontsize=12)
+    axes[1].set_ylabel('Frequência', fontsize=12)
+    axes[1].set_title('Distribuição do Tempo de Resposta', fontsize=14, fontweight='bold')
+    axes[1].legend()
+    axes[1].grid(True, alpha=0.3, axis='y')
+    
+    # Margens fixas: evita o ajuste iterativo de tight_layout/bbox_inches
+    fig.subplots_adjust(left=0.06, right=0.98, top=0.92, bottom=0.1, wspace=0.2)
+    fig.savefig(out_path, dpi=dpi)
+    print(f"Gráfico salvo: {out_path.name}")
+
 
 class ExperimentDashboard:
-    def __init__(self, csv_file: str = "experiment_data.csv"):
+    def __init__(self, csv_file: str = "experiment_data.csv", dpi: int = 150):
         """
         Inicializa o dashboard
         
         Args:
             csv_file: Caminho para o arquivo CSV com os dados do experimento
+            dpi: Resolução dos gráficos salvos em PNG
         """
         self.csv_file = csv_file
+        self.dpi = dpi
         self.df = None
+        self._by_api = {}
         self.output_dir = Path("dashboard_output")
         self.output_dir.mkdir(exist_ok=True)
     
     def load_data(self) -> bool:
-        """Carrega os dados do CSV"""
+        """Carrega os dados do CSV (ou do cache Parquet, se estiver atualizado)"""
         try:
-            self.df = pd.read_csv(self.csv_file)
-            print(f"Dados carregados: {len(self.df)} medições")
-            
-            # Filtra apenas medições bem-sucedidas
-            self.df = self.df[self.df['success'] == True].copy()
-            print(f"Medições bem-sucedidas: {len(self.df)}")
-            
-            # Converte tipos
-            self.df['response_time_ms'] = pd.to_numeric(self.df['response_time_ms'], errors='coerce')
-            self.df['response_size_bytes'] = pd.to_numeric(self.df['response_size_bytes'], errors='coerce')
+            cache = self.output_dir / '_cache.parquet'
+            source = self._csv_source()
+            if HAS_PYARROW and self._cache_source(cache) == source:
+                self.df = pd.read_parquet(cache)
+                print(f"Dados carregados do cache: {len(self.df)} medições bem-sucedidas")
+            else:
+                self.df = self._read_csv()
+                if HAS_PYARROW:
+                    try:
+                        table = pa.Table.from_pandas(self.df, preserve_index=False)
+                        table = table.replace_schema_metadata({**table.schema.metadata, CACHE_SOURCE_KEY: source})
+                        pq.write_table(table, cache, compression='zstd')
+                    except Exception as e:
+                        print(f"Aviso: não foi possível salvar o cache Parquet: {e}")
             
-            # Cria coluna combinada para identificação
-            self.df['repository'] = self.df['repository_owner'] + '/' + self.df['repository_name']
+            # Separa os dados por tipo de API uma única vez
+            self._by_api = dict(list(self.df.groupby('api_type', observed=True)))
             
             return True
         except Exception as e:
             print(f"Erro ao carregar dados: {e}")
             return False
     
+    def _csv_source(self) -> bytes:
+        """Identificação do CSV de origem: caminho resolvido, tamanho e st_mtime_ns (e a versão do cache)"""
+        st = os.stat(self.csv_file)
+        return f"{CACHE_VERSION}|{Path(self.csv_file).resolve()}|{st.st_size}|{st.st_mtime_ns}".encode()
+    
+    @staticmethod
+    def _cache_source(cache: Path):
+        """Identificação do CSV gravada no cache Parquet (None se ausente ou ilegível)"""
+        try:
+            return (pq.read_schema(cache).metadata or {}).get(CACHE_SOURCE_KEY)
+        except (OSError, pa.ArrowException):
+            return None
+    
+    def _read_csv(self) -> pd.DataFrame:
+        """Lê o CSV, mantém as medições bem-sucedidas e prepara as colunas derivadas"""
+        read_options = {
+            'usecols': [*CSV_DTYPES, 'response_time_ms', 'response_size_bytes'],
+            'dtype': CSV_DTYPES,
+        }
+        if CSV_ENGINE == 'pyarrow':
+            # Parser multithread do Arrow; não suporta chunksize
+            reader = [pd.read_csv(self.csv_file, engine='pyarrow', **read_options)]
+        else:
+            reader = pd.read_csv(self.csv_file, chunksize=CSV_CHUNKSIZE, **read_options)
+        
+        # Lê em blocos e mantém apenas medições bem-sucedidas de cada bloco
+        # (a indexação booleana já materializa um novo DataFrame; .copy() duplicaria)
+        total = 0
+        successful = []
+        for chunk in reader:
+            total += len(chunk)
+            successful.append(chunk.loc[chunk['success'].to_numpy(copy=False)])
+        print(f"Dados carregados: {total} medições")
+        
+        df = pd.concat(successful, ignore_index=True)
+        # Blocos com categorias diferentes são concatenados como object
+        for column, dtype in CSV_DTYPES.items():
+            if dtype == 'category':
+                df[column] = df[column].astype('category')
+        print(f"Medições bem-sucedidas: {len(df)}")
+        
+        # Converte tipos (float64: com float32 as medianas/médias das tabelas mudam no arredondamento
+        # de 2 casas, p.ex. 224.57 -> 224.58; float mantém NaN)
+        df['response_time_ms'] = pd.to_numeric(df['response_time_ms'], errors='coerce').astype('float64')
+        df['response_size_bytes'] = pd.to_numeric(df['response_size_bytes'], errors='coerce').astype('float64')
+        
+        # Remove valores inválidos uma única vez; os gráficos não precisam de dropna()
+        df = df.dropna(subset=['response_time_ms', 'response_size_bytes'])
+        
+        # Tamanho em KB calculado uma única vez para gráficos e tabelas
+        df['response_size_kb'] = df['response_size_bytes'].to_numpy() / 1024
+        
+        return df
+    
+    def _response_time_plot(self):
+        """Gráfico 1 como chamada parcial: recebe só os arrays de tempo"""
+        return partial(
+            _plot_distribution,
+            [self._by_api['graphql']['response_time_ms'].values, self._by_api['rest']['response_time_ms'].values],
+            ['#3498db', '#e74c3c'], 'Tempo de Resposta (ms)',
+            'Distribuição do Tempo de Resposta\nGraphQL vs REST', 'Distribuição Detalhada do Tempo de Resposta',
+            self.output_dir / 'response_time_comparison.png', self.dpi)
+    
+    def _response_size_plot(self):
+        """Gráfico 2 como chamada parcial: recebe só os arrays de tamanho"""
+        return partial(
+            _plot_distribution,
+            [self._by_api['graphql']['response_size_kb'].values, self._by_api['rest']['response_size_kb'].values],
+            ['#2ecc71', '#f39c12'], 'Tamanho da Resposta (KB)',
+            'Distribuição do Tamanho da Resposta\nGraphQL vs REST', 'Distribuição Detalhada do Tamanho da Resposta',
+            self.output_dir / 'response_size_comparison.png', self.dpi)
+    
+    def _by_query_type_plot(self):
+        """Gráfico 3 como chamada parcial: arrays por (api_type, query_type) e as médias"""
+        # Agrupa uma única vez por (api_type, query_type)
+        grouped = self.df.groupby(['api_type', 'query_type'], observed=True)
+        grouped_time = {k: v.values for k, v in grouped['response_time_ms']}
+        grouped_size = {k: v.values for k, v in grouped['response_size_kb']}
+        means = grouped[['response_time_ms', 'response_size_kb']].mean().unstack('api_type')
+        return partial(_plot_by_query_type, grouped_time, grouped_size, means,
+                       self.output_dir / 'comparison_by_query_type.svg')
+    
+    def _scatter_plot(self):
+        """Gráfico 4 como chamada parcial: tempos e tamanhos de cada API"""
+        series = tuple((data['response_time_ms'].to_numpy(), data['response_size_kb'].to_numpy())
+                       for data in (self._by_api['graphql'], self._by_api['rest']))
+        return partial(_plot_scatter, series, self.output_dir / 'scatter_comparison.png', self.dpi)
+    
     def plot_response_time_comparison(self):
         """Gráfico 1: Comparação de tempo de resposta - Boxplot"""
-        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
-        
-        # Boxplot
-        data_to_plot = [
-            self.df[self.df['api_type'] == 'graphql']['response_time_ms'].dropna(),
-            self.df[self.df['api_type'] == 'rest']['response_time_ms'].dropna()
-        ]
-        
-        bp = axes[0].boxplot(data_to_plot, labels=['GraphQL', 'REST'], patch_artist=True)
-        bp['boxes'][0].set_facecolor('#3498db')
-        bp['boxes'][1].set_facecolor('#e74c3c')
-        axes[0].set_ylabel('Tempo de Resposta (ms)', fontsize=12)
-        axes[0].set_title('Distribuição do Tempo de Resposta\nGraphQL vs REST', fontsize=14, fontweight='bold')
-        axes[0].grid(True, alpha=0.3)
-        
-        # Violin plot
-        sns.violinplot(data=self.df, x='api_type', y='response_time_ms', ax=axes[1], palette=['#3498db', '#e74c3c'])
-        axes[1].set_xlabel('Tipo de API', fontsize=12)
-        axes[1].set_ylabel('Tempo de Resposta (ms)', fontsize=12)
-        axes[1].set_title('Distribuição Detalhada do Tempo de Resposta', fontsize=14, fontweight='bold')
-        axes[1].grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'response_time_comparison.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        print("Gráfico salvo: response_time_comparison.png")
+        self._response_time_plot()()
     
     def plot_response_size_comparison(self):
         """Gráfico 2: Comparação de tamanho da resposta - Boxplot"""
-        fig, axes = plt.subplots(1, 2, figsize=(14, 6))
-        
-        # Boxplot
-        data_to_plot = [
-            self.df[self.df['api_type'] == 'graphql']['response_size_bytes'].dropna() / 1024,  # KB
-            self.df[self.df['api_type'] == 'rest']['response_size_bytes'].dropna() / 1024  # KB
-        ]
-        
-        bp = axes[0].boxplot(data_to_plot, labels=['GraphQL', 'REST'], patch_artist=True)
-        bp['boxes'][0].set_facecolor('#2ecc71')
-        bp['boxes'][1].set_facecolor('#f39c12')
-        axes[0].set_ylabel('Tamanho da Resposta (KB)', fontsize=12)
-        axes[0].set_title('Distribuição do Tamanho da Resposta\nGraphQL vs REST', fontsize=14, fontweight='bold')
-        axes[0].grid(True, alpha=0.3)
-        
-        # Violin plot
-        df_kb = self.df.copy()
-        df_kb['response_size_kb'] = df_kb['response_size_bytes'] / 1024
-        sns.violinplot(data=df_kb, x='api_type', y='response_size_kb', ax=axes[1], palette=['#2ecc71', '#f39c12'])
-        axes[1].set_xlabel('Tipo de API', fontsize=12)
-        axes[1].set_ylabel('Tamanho da Resposta (KB)', fontsize=12)
-        axes[1].set_title('Distribuição Detalhada do Tamanho da Resposta', fontsize=14, fontweight='bold')
-        axes[1].grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'response_size_comparison.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        print("Gráfico salvo: response_size_comparison.png")
+        self._response_size_plot()()
     
     def plot_by_query_type(self):
         """Gráfico 3: Comparação por tipo de consulta"""
-        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-        
-        query_types = ['simple', 'complex', 'multiple']
-        query_labels = ['Simples', 'Complexa', 'Múltiplos Recursos']
-        
-        # Tempo por tipo de consulta
-        time_data = []
-        for qt in query_types:
-            graphql_times = self.df[(self.df['api_type'] == 'graphql') & (self.df['query_type'] == qt)]['response_time_ms'].dropna()
-            rest_times = self.df[(self.df['api_type'] == 'rest') & (self.df['query_type'] == qt)]['response_time_ms'].dropna()
-            time_data.append([graphql_times, rest_times])
-        
-        # Boxplot de tempo por tipo
-        positions = [1, 2, 3]
-        width = 0.6
-        for i, (qt, label) in enumerate(zip(query_types, query_labels)):
-            graphql_data = time_data[i][0]
-            rest_data = time_data[i][1]
-            
-            bp1 = axes[0, 0].boxplot([graphql_data], positions=[positions[i] - width/2], widths=width/2, 
-                                    patch_artist=True, labels=[f'{label}\nGraphQL'])
-            bp2 = axes[0, 0].boxplot([rest_data], positions=[positions[i] + width/2], widths=width/2, 
-                                     patch_artist=True, labels=[f'{label}\nREST'])
-            bp1['boxes'][0].set_facecolor('#3498db')
-            bp2['boxes'][0].set_facecolor('#e74c3c')
-        
-        axes[0, 0].set_xticks(positions)
-        axes[0, 0].set_xticklabels(query_labels)
-        axes[0, 0].set_ylabel('Tempo de Resposta (ms)', fontsize=12)
-        axes[0, 0].set_title('Tempo de Resposta por Tipo de Consulta', fontsize=14, fontweight='bold')
-        axes[0, 0].grid(True, alpha=0.3)
-        
-        # Tamanho por tipo de consulta
-        size_data = []
-        for qt in query_types:
-            graphql_sizes = self.df[(self.df['api_type'] == 'graphql') & (self.df['query_type'] == qt)]['response_size_bytes'].dropna() / 1024
-            rest_sizes = self.df[(self.df['api_type'] == 'rest') & (self.df['query_type'] == qt)]['response_size_bytes'].dropna() / 1024
-            size_data.append([graphql_sizes, rest_sizes])
-        
-        for i, (qt, label) in enumerate(zip(query_types, query_labels)):
-            graphql_data = size_data[i][0]
-            rest_data = size_data[i][1]
-            
-            bp1 = axes[0, 1].boxplot([graphql_data], positions=[positions[i] - width/2], widths=width/2, 
-                                    patch_artist=True)
-            bp2 = axes[0, 1].boxplot([rest_data], positions=[positions[i] + width/2], widths=width/2, 
-                                     patch_artist=True)
-            bp1['boxes'][0].set_facecolor('#2ecc71')
-            bp2['boxes'][0].set_facecolor('#f39c12')
-        
-        axes[0, 1].set_xticks(positions)
-        axes[0, 1].set_xticklabels(query_labels)
-        axes[0, 1].set_ylabel('Tamanho da Resposta (KB)', fontsize=12)
-        axes[0, 1].set_title('Tamanho da Resposta por Tipo de Consulta', fontsize=14, fontweight='bold')
-        axes[0, 1].grid(True, alpha=0.3)
-        
-        # Médias de tempo
-        time_means = []
-        for qt in query_types:
-            graphql_mean = self.df[(self.df['api_type'] == 'graphql') & (self.df['query_type'] == qt)]['response_time_ms'].mean()
-            rest_mean = self.df[(self.df['api_type'] == 'rest') & (self.df['query_type'] == qt)]['response_time_ms'].mean()
-            time_means.append({'GraphQL': graphql_mean, 'REST': rest_mean})
-        
-        x = np.arange(len(query_labels))
-        width = 0.35
-        graphql_means = [tm['GraphQL'] for tm in time_means]
-        rest_means = [tm['REST'] for tm in time_means]
-        
-        axes[1, 0].bar(x - width/2, graphql_means, width, label='GraphQL', color='#3498db')
-        axes[1, 0].bar(x + width/2, rest_means, width, label='REST', color='#e74c3c')
-        axes[1, 0].set_xlabel('Tipo de Consulta', fontsize=12)
-        axes[1, 0].set_ylabel('Tempo Médio (ms)', fontsize=12)
-        axes[1, 0].set_title('Tempo Médio de Resposta por Tipo', fontsize=14, fontweight='bold')
-        axes[1, 0].set_xticks(x)
-        axes[1, 0].set_xticklabels(query_labels)
-        axes[1, 0].legend()
-        axes[1, 0].grid(True, alpha=0.3, axis='y')
-        
-        # Médias de tamanho
-        size_means = []
-        for qt in query_types:
-            graphql_mean = self.df[(self.df['api_type'] == 'graphql') & (self.df['query_type'] == qt)]['response_size_bytes'].mean() / 1024
-            rest_mean = self.df[(self.df['api_type'] == 'rest') & (self.df['query_type'] == qt)]['response_size_bytes'].mean() / 1024
-            size_means.append({'GraphQL': graphql_mean, 'REST': rest_mean})
-        
-        graphql_size_means = [sm['GraphQL'] for sm in size_means]
-        rest_size_means = [sm['REST'] for sm in size_means]
-        
-        axes[1, 1].bar(x - width/2, graphql_size_means, width, label='GraphQL', color='#2ecc71')
-        axes[1, 1].bar(x + width/2, rest_size_means, width, label='REST', color='#f39c12')
-        axes[1, 1].set_xlabel('Tipo de Consulta', fontsize=12)
-        axes[1, 1].set_ylabel('Tamanho Médio (KB)', fontsize=12)
-        axes[1, 1].set_title('Tamanho Médio da Resposta por Tipo', fontsize=14, fontweight='bold')
-        axes[1, 1].set_xticks(x)
-        axes[1, 1].set_xticklabels(query_labels)
-        axes[1, 1].legend()
-        axes[1, 1].grid(True, alpha=0.3, axis='y')
-        
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'comparison_by_query_type.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        print("Gráfico salvo: comparison_by_query_type.png")
+        self._by_query_type_plot()()
     
     def plot_scatter_comparison(self):
         """Gráfico 4: Scatter plot - Tempo vs Tamanho"""
-        fig, axes = plt.subplots(1, 2, figsize=(16, 6))
-        
-        graphql_data = self.df[self.df['api_type'] == 'graphql']
-        rest_data = self.df[self.df['api_type'] == 'rest']
-        
-        # Scatter plot - Tempo vs Tamanho
-        axes[0].scatter(graphql_data['response_time_ms'], graphql_data['response_size_bytes'] / 1024, 
-                       alpha=0.5, label='GraphQL', color='#3498db', s=30)
-        axes[0].scatter(rest_data['response_time_ms'], rest_data['response_size_bytes'] / 1024, 
-                       alpha=0.5, label='REST', color='#e74c3c', s=30)
-        axes[0].set_xlabel('Tempo de Resposta (ms)', fontsize=12)
-        axes[0].set_ylabel('Tamanho da Resposta (KB)', fontsize=12)
-        axes[0].set_title('Relação entre Tempo e Tamanho da Resposta', fontsize=14, fontweight='bold')
-        axes[0].legend()
-        axes[0].grid(True, alpha=0.3)
-        
-        # Histograma comparativo - Tempo
-        axes[1].hist(graphql_data['response_time_ms'].dropna(), bins=50, alpha=0.6, 
-                   label='GraphQL', color='#3498db', edgecolor='black')
-        axes[1].hist(rest_data['response_time_ms'].dropna(), bins=50, alpha=0.6, 
-                   label='REST', color='#e74c3c', edgecolor='black')
-        axes[1].set_xlabel('Tempo de Resposta (ms)', fontsize=12)
-        axes[1].set_ylabel('Frequência', fontsize=12)
-        axes[1].set_title('Distribuição do Tempo de Resposta', fontsize=14, fontweight='bold')
-        axes[1].legend()
-        axes[1].grid(True, alpha=0.3, axis='y')
-        
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'scatter_comparison.png', dpi=300, bbox_inches='tight')
-        plt.close()
-        print("Gráfico salvo: scatter_comparison.png")
+        self._scatter_plot()()
     
     def generate_summary_table(self):
         """Gera tabela resumo das estatísticas"""
-        summary_data = []
-        
-        for api_type in ['graphql', 'rest']:
-            data = self.df[self.df['api_type'] == api_type]
-            
-            summary_data.append({
-                'API': api_type.upper(),
-                'Tempo Médio (ms)': f"{data['response_time_ms'].mean():.2f}",
-                'Tempo Mediano (ms)': f"{data['response_time_ms'].median():.2f}",
-                'Desvio Padrão Tempo (ms)': f"{data['response_time_ms'].std():.2f}",
-                'Tamanho Médio (KB)': f"{data['response_size_bytes'].mean() / 1024:.2f}",
-                'Tamanho Mediano (KB)': f"{data['response_size_bytes'].median() / 1024:.2f}",
-                'Desvio Padrão Tamanho (KB)': f"{data['response_size_bytes'].std() / 1024:.2f}",
-                'Número de Medições': len(data)
-            })
-        
-        summary_df = pd.DataFrame(summary_data)
+        aggregations = {
+            'time_med': ('response_time_ms', 'median'),
+            'size_med': ('response_size_kb', 'median'),
+            'n': ('response_time_ms', 'size')
+        }
+        use_numba = _mean_std is not None and len(self.df) >= NUMBA_MIN_ROWS
+        if not use_numba:
+            aggregations.update(
+                time_mean=('response_time_ms', 'mean'),
+                time_std=('response_time_ms', 'std'),
+                size_mean=('response_size_kb', 'mean'),
+                size_std=('response_size_kb', 'std')
+            )
+        
+        stats = self.df.groupby('api_type', observed=True).agg(**aggregations).reindex(['graphql', 'rest'])
+        
+        if use_numba:
+            for column, prefix in (('response_time_ms', 'time'), ('response_size_kb', 'size')):
+                moments = {
+                    api_type: _mean_std(data[column].to_numpy(copy=False))
+                    for api_type, data in self._by_api.items()
+                }
+                stats[f'{prefix}_mean'] = pd.Series({k: m[0] for k, m in moments.items()})
+                stats[f'{prefix}_std'] = pd.Series({k: m[1] for k, m in moments.items()})
+        
+        labels = {
+            'time_mean': 'Tempo Médio (ms)',
+            'time_med': 'Tempo Mediano (ms)',
+            'time_std': 'Desvio Padrão Tempo (ms)',
+            'size_mean': 'Tamanho Médio (KB)',
+            'size_med': 'Tamanho Mediano (KB)',
+            'size_std': 'Desvio Padrão Tamanho (KB)'
+        }
+        # Formata todas as células numéricas de uma vez
+        summary_df = pd.DataFrame(np.char.mod('%.2f', stats[list(labels)].to_numpy()), columns=list(labels.values()))
+        summary_df.insert(0, 'API', stats.index.str.upper())
+        summary_df['Número de Medições'] = stats['n'].fillna(0).astype(int).to_numpy()
         
         # Salva como CSV
         summary_df.to_csv(self.output_dir / 'summary_statistics.csv', index=False)
@@ -305,24 +559,28 @@ class ExperimentDashboard:
     
     def generate_detailed_table_by_query_type(self):
         """Gera tabela detalhada por tipo de consulta"""
-        detailed_data = []
-        
-        for api_type in ['graphql', 'rest']:
-            for query_type in ['simple', 'complex', 'multiple']:
-                data = self.df[(self.df['api_type'] == api_type) & (self.df['query_type'] == query_type)]
-                
-                if len(data) > 0:
-                    detailed_data.append({
-                        'API': api_type.upper(),
-                        'Tipo de Consulta': query_type,
-                        'Tempo Médio (ms)': f"{data['response_time_ms'].mean():.2f}",
-                        'Tempo Mediano (ms)': f"{data['response_time_ms'].median():.2f}",
-                        'Tamanho Médio (KB)': f"{data['response_size_bytes'].mean() / 1024:.2f}",
-                        'Tamanho Mediano (KB)': f"{data['response_size_bytes'].median() / 1024:.2f}",
-                        'Número de Medições': len(data)
-                    })
-        
-        detailed_df = pd.DataFrame(detailed_data)
+        order = pd.MultiIndex.from_product(
+            [['graphql', 'rest'], ['simple', 'complex', 'multiple']],
+            names=['api_type', 'query_type']
+        )
+        stats = self.df.groupby(['api_type', 'query_type'], observed=True).agg(
+            time_mean=('response_time_ms', 'mean'),
+            time_med=('response_time_ms', 'median'),
+            size_mean=('response_size_kb', 'mean'),
+            size_med=('response_size_kb', 'median'),
+            n=('response_time_ms', 'size')
+        ).reindex(order).dropna(subset=['n'])
+        
+        labels = {
+            'time_mean': 'Tempo Médio (ms)',
+            'time_med': 'Tempo Mediano (ms)',
+            'size_mean': 'Tamanho Médio (KB)',
+            'size_med': 'Tamanho Mediano (KB)'
+        }
+        detailed_df = pd.DataFrame(np.char.mod('%.2f', stats[list(labels)].to_numpy()), columns=list(labels.values()))
+        detailed_df.insert(0, 'API', stats.index.get_level_values('api_type').str.upper())
+        detailed_df.insert(1, 'Tipo de Consulta', stats.index.get_level_values('query_type'))
+        detailed_df['Número de Medições'] = stats['n'].astype(int).to_numpy()
         detailed_df.to_csv(self.output_dir / 'detailed_statistics_by_query_type.csv', index=False)
         print("Tabela detalhada salva: detailed_statistics_by_query_type.csv")
         
@@ -339,10 +597,11 @@ class ExperimentDashboard:
             return
         
         print("\nGerando gráficos...")
-        self.plot_response_time_comparison()
-        self.plot_response_size_comparison()
-        self.plot_by_query_type()
-        self.plot_scatter_comparison()
+        # Gráficos independentes: cada um é renderizado em um processo, recebendo só os arrays que usa
+        plots = [self._response_time_plot(), self._response_size_plot(),
+                 self._by_query_type_plot(), self._scatter_plot()]
+        with ProcessPoolExecutor(max_workers=len(plots), initializer=_setup_plot_style) as executor:
+            list(executor.map(_render, plots))
         
         print("\nGerando tabelas...")
         summary_table = self.generate_summary_table()
@@ -355,7 +614,7 @@ class ExperimentDashboard:
         print("\nGráficos:")
         print("  - response_time_comparison.png")
         print("  - response_size_comparison.png")
-        print("  - comparison_by_query_type.png")
+        print("  - comparison_by_query_type.svg")
         print("  - scatter_comparison.png")
         print("\nTabelas:")
         print("  - summary_statistics.csv")
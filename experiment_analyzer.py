@@ -7,11 +7,75 @@ Script para análise estatística dos dados do experimento GraphQL vs REST
 import pandas as pd
 import numpy as np
 from scipy import stats
-from scipy.stats import shapiro, wilcoxon, ttest_rel
+from scipy.stats import shapiro, wilcoxon, ttest_1samp
+try:
+    # Núcleo do shapiro() do scipy; permite reaproveitar os coeficientes de Royston entre chamadas
+    from scipy.stats._morestats import swilk as _swilk
+except ImportError:  # API interna: se mudar, usa shapiro() diretamente
+    _swilk = None
 from typing import Dict, Tuple
+import sys
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit
+except ImportError:  # numba é opcional
+    njit = None
+
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:  # pyarrow é opcional; sem ele usa o engine C
+    CSV_ENGINE = 'c'
+
+# Apenas as colunas usadas na análise, com tipos explícitos (sem inferência).
+# Chaves de baixa cardinalidade como category: comparações e groupby usam códigos inteiros.
+CSV_DTYPES = {
+    'api_type': 'category',
+    'query_type': 'category',
+    'repository_owner': 'category',
+    'repository_name': 'category',
+    'success': 'bool',
+}
+# Métricas convertidas após a leitura com to_numeric(errors='coerce'): uma célula malformada vira
+# NaN em vez de abortar a carga, e os valores ficam em float64 (float32 altera as estatísticas publicadas)
+METRIC_COLUMNS = ['response_time_ms', 'response_size_bytes']
+CSV_CHUNKSIZE = 500_000
+
+# A partir deste tamanho de array, as estatísticas descritivas usam o kernel numba (se disponível)
+NUMBA_MIN_ROWS = 1_000_000
+
+if njit is not None:
+    @njit(cache=True)
+    def _moments(x):
+        """Média, desvio (ddof=0), mínimo e máximo em uma única passada (Welford)"""
+        n = x.shape[0]
+        mean = 0.0
+        m2 = 0.0
+        mn = np.inf
+        mx = -np.inf
+        for i in range(n):
+            v = float(x[i])
+            if np.isnan(v):
+                return np.nan, np.nan, np.nan, np.nan
+            delta = v - mean
+            mean += delta / (i + 1)
+            m2 += delta * (v - mean)
+            if v < mn:
+                mn = v
+            if v > mx:
+                mx = v
+        return mean, np.sqrt(m2 / n), mn, mx
+else:
+    _moments = None
+
+# Acima disso o p-value do Shapiro-Wilk deixa de ser confiável
+SHAPIRO_MAX_N = 5000
+
+# Ordem de apresentação dos tipos de consulta
+QUERY_TYPES = ['simple', 'complex', 'multiple']
+
 class ExperimentAnalyzer:
     def __init__(self, csv_file: str = "experiment_data.csv"):
         """
@@ -22,47 +86,137 @@ class ExperimentAnalyzer:
         """
         self.csv_file = csv_file
         self.df = None
+        self._paired = None
+        self._mask_g = self._mask_r = None
+        self._t_g = self._t_r = None
+        self._s_g = self._s_r = None
         self.results = {}
+        self._rng = np.random.default_rng()
+        self._shapiro_coef = {}
     
     def load_data(self) -> bool:
         """Carrega os dados do CSV"""
         try:
-            self.df = pd.read_csv(self.csv_file)
-            print(f"Dados carregados: {len(self.df)} medições")
+            read_options = {'usecols': [*CSV_DTYPES, *METRIC_COLUMNS], 'dtype': CSV_DTYPES}
+            if CSV_ENGINE == 'pyarrow':
+                # Parser multithread do Arrow; não suporta chunksize
+                reader = [pd.read_csv(self.csv_file, engine='pyarrow', **read_options)]
+            else:
+                reader = pd.read_csv(self.csv_file, chunksize=CSV_CHUNKSIZE, **read_options)
             
-            # Filtra apenas medições bem-sucedidas
-            self.df = self.df[self.df['success'] == True].copy()
+            # Filtra as medições bem-sucedidas bloco a bloco, sem manter o arquivo inteiro + cópia
+            total = 0
+            successful = []
+            for chunk in reader:
+                total += len(chunk)
+                successful.append(chunk.loc[chunk['success'].to_numpy(copy=False)])
+            print(f"Dados carregados: {total} medições")
+            
+            self.df = pd.concat(successful, ignore_index=True)
+            # Blocos com categorias diferentes são concatenados como object
+            for col, dtype in CSV_DTYPES.items():
+                if dtype == 'category':
+                    self.df[col] = self.df[col].astype('category')
             print(f"Medições bem-sucedidas: {len(self.df)}")
             
             # Converte tipos
-            self.df['response_time_ms'] = pd.to_numeric(self.df['response_time_ms'], errors='coerce')
-            self.df['response_size_bytes'] = pd.to_numeric(self.df['response_size_bytes'], errors='coerce')
+            for col in METRIC_COLUMNS:
+                self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
+            self.results = {}
+            
+            # Máscaras por API comparando os códigos int8 da categoria, guardadas para reuso
+            codes = self.df['api_type'].cat.codes.to_numpy()
+            categories = self.df['api_type'].cat.categories
+            self._mask_g, self._mask_r = (
+                codes == categories.get_loc(api) if api in categories else np.zeros(codes.size, dtype=bool)
+                for api in ('graphql', 'rest')
+            )
+            mask_g, mask_r = self._mask_g, self._mask_r
+            
+            # Separa GraphQL/REST uma única vez em arrays contíguos
+            times = self.df['response_time_ms'].to_numpy(copy=False)
+            sizes = self.df['response_size_bytes'].to_numpy(copy=False)
+            self._t_g, self._t_r = times[mask_g], times[mask_r]
+            self._s_g, self._s_r = sizes[mask_g], sizes[mask_r]
+            
+            # Médias pareadas de RQ1 e RQ2: um groupby por API sobre os frames já separados,
+            # alinhados pelo índice (repositório, tipo) sem chave api_type nem unstack
+            keys = ['repository_owner', 'repository_name', 'query_type']
+            metrics = ['response_time_ms', 'response_size_bytes']
+            self._paired = pd.concat({
+                'graphql': self.df.loc[mask_g].groupby(keys, sort=False, observed=True)[metrics].mean(),
+                'rest': self.df.loc[mask_r].groupby(keys, sort=False, observed=True)[metrics].mean(),
+            }, axis=1).swaplevel(axis=1)
             
             return True
         except Exception as e:
             print(f"Erro ao carregar dados: {e}")
             return False
     
-    def test_normality(self, data: pd.Series) -> Tuple[bool, float]:
+    def test_normality(self, data: np.ndarray) -> Tuple[bool, float]:
         """
         Testa normalidade dos dados usando Shapiro-Wilk
         
         Returns:
             Tuple: (é_normal, p_value)
         """
-        if len(data) < 3:
+        data = np.asarray(data)
+        if data.size < 3:
             return False, 1.0
         
         # Limita tamanho da amostra para o teste (máximo 5000)
-        sample = data.sample(min(5000, len(data))) if len(data) > 5000 else data
+        sample = self._rng.choice(data, SHAPIRO_MAX_N, replace=False) if data.size > SHAPIRO_MAX_N else data
         
         try:
-            stat, p_value = shapiro(sample)
+            stat, p_value = self._shapiro(sample)
             is_normal = p_value > 0.05
             return is_normal, p_value
         except:
             return False, 0.0
     
+    def _shapiro(self, sample: np.ndarray) -> Tuple[float, float]:
+        """
+        Shapiro-Wilk com os coeficientes cacheados por tamanho de amostra
+        
+        Os coeficientes dependem apenas de n; como amostras grandes são sempre
+        reduzidas a SHAPIRO_MAX_N, são calculados uma vez e reaproveitados.
+        Amostras com NaN/inf vão para shapiro(), que aplica a política de NaN (p = nan).
+        """
+        x = np.ravel(sample).astype(np.float64)
+        if _swilk is None or not np.isfinite(x).all():
+            return shapiro(sample)
+        
+        n = x.size
+        a = self._shapiro_coef.get(n)
+        init = a is not None
+        if not init:
+            a = np.zeros(n // 2, dtype=np.float64)
+        
+        # Mesmo pré-processamento de scipy.stats.shapiro
+        y = np.sort(x)
+        y -= x[n // 2]
+        w, pw, ifault = _swilk(y, a, init)
+        if ifault not in (0, 2):
+            return shapiro(sample)
+        self._shapiro_coef[n] = a
+        return w, pw
+    
+    def _describe(self, data: np.ndarray) -> Dict:
+        """Estatísticas descritivas: média/desvio/mín/máx em uma passada + mediana"""
+        if _moments is not None and data.size >= NUMBA_MIN_ROWS:
+            mean, std, mn, mx = _moments(data)
+        else:
+            d = stats.describe(data, ddof=0)
+            mean, std, mn, mx = d.mean, np.sqrt(d.variance), d.minmax[0], d.minmax[1]
+        return {
+            'mean': mean,
+            'median': np.median(data),
+            'std': std,
+            'min': mn,
+            'max': mx,
+            'count': data.size
+        }
+    
     def analyze_rq1(self) -> Dict:
         """
         Analisa RQ1: Respostas às consultas GraphQL são mais rápidas que REST?
@@ -70,108 +224,71 @@ class ExperimentAnalyzer:
         Returns:
             Dict com resultados da análise
         """
-        print("\n" + "="*60)
-        print("ANÁLISE RQ1: Tempo de Resposta")
-        print("="*60)
+        if 'rq1' in self.results:
+            return self.results['rq1']
         
-        # Agrupa por repositório e tipo de consulta para fazer comparação pareada
-        results = []
+        # Saída acumulada e escrita de uma vez (uma única chamada a sys.stdout.write)
+        lines = []
+        out = lines.append
         
-        for (repo_owner, repo_name, query_type), group in self.df.groupby(['repository_owner', 'repository_name', 'query_type']):
-            graphql_times = group[group['api_type'] == 'graphql']['response_time_ms'].values
-            rest_times = group[group['api_type'] == 'rest']['response_time_ms'].values
-            
-            if len(graphql_times) > 0 and len(rest_times) > 0:
-                # Calcula médias para comparação pareada
-                graphql_mean = np.mean(graphql_times)
-                rest_mean = np.mean(rest_times)
-                
-                results.append({
-                    'repository': f"{repo_owner}/{repo_name}",
-                    'query_type': query_type,
-                    'graphql_mean': graphql_mean,
-                    'rest_mean': rest_mean,
-                    'difference': graphql_mean - rest_mean,
-                    'graphql_data': graphql_times,
-                    'rest_data': rest_times
-                })
+        out("\n" + "="*60)
+        out("ANÁLISE RQ1: Tempo de Resposta")
+        out("="*60)
+        
+        # Médias pareadas por repositório e tipo de consulta (calculadas em load_data)
+        pivot = self._paired['response_time_ms'].reindex(columns=['graphql', 'rest']).dropna()
+        paired_differences = pivot['graphql'].to_numpy(copy=False) - pivot['rest'].to_numpy(copy=False)
         
         # Agrega todos os dados para análise geral
-        all_graphql_times = self.df[self.df['api_type'] == 'graphql']['response_time_ms'].values
-        all_rest_times = self.df[self.df['api_type'] == 'rest']['response_time_ms'].values
+        all_graphql_times = self._t_g
+        all_rest_times = self._t_r
         
         # Estatísticas descritivas
-        graphql_stats = {
-            'mean': np.mean(all_graphql_times),
-            'median': np.median(all_graphql_times),
-            'std': np.std(all_graphql_times),
-            'min': np.min(all_graphql_times),
-            'max': np.max(all_graphql_times),
-            'count': len(all_graphql_times)
-        }
-        
-        rest_stats = {
-            'mean': np.mean(all_rest_times),
-            'median': np.median(all_rest_times),
-            'std': np.std(all_rest_times),
-            'min': np.min(all_rest_times),
-            'max': np.max(all_rest_times),
-            'count': len(all_rest_times)
-        }
+        graphql_stats = self._describe(all_graphql_times)
+        rest_stats = self._describe(all_rest_times)
         
-        print(f"\nEstatísticas Descritivas - GraphQL:")
-        print(f"  Média: {graphql_stats['mean']:.2f} ms")
-        print(f"  Mediana: {graphql_stats['median']:.2f} ms")
-        print(f"  Desvio Padrão: {graphql_stats['std']:.2f} ms")
+        out(f"\nEstatísticas Descritivas - GraphQL:")
+        out(f"  Média: {graphql_stats['mean']:.2f} ms")
+        out(f"  Mediana: {graphql_stats['median']:.2f} ms")
+        out(f"  Desvio Padrão: {graphql_stats['std']:.2f} ms")
         
-        print(f"\nEstatísticas Descritivas - REST:")
-        print(f"  Média: {rest_stats['mean']:.2f} ms")
-        print(f"  Mediana: {rest_stats['median']:.2f} ms")
-        print(f"  Desvio Padrão: {rest_stats['std']:.2f} ms")
+        out(f"\nEstatísticas Descritivas - REST:")
+        out(f"  Média: {rest_stats['mean']:.2f} ms")
+        out(f"  Mediana: {rest_stats['median']:.2f} ms")
+        out(f"  Desvio Padrão: {rest_stats['std']:.2f} ms")
         
         # Teste de normalidade
-        graphql_normal, graphql_p = self.test_normality(pd.Series(all_graphql_times))
-        rest_normal, rest_p = self.test_normality(pd.Series(all_rest_times))
+        graphql_normal, graphql_p = self.test_normality(all_graphql_times)
+        rest_normal, rest_p = self.test_normality(all_rest_times)
         
-        print(f"\nTeste de Normalidade:")
-        print(f"  GraphQL: {'Normal' if graphql_normal else 'Não Normal'} (p={graphql_p:.4f})")
-        print(f"  REST: {'Normal' if rest_normal else 'Não Normal'} (p={rest_p:.4f})")
+        out(f"\nTeste de Normalidade:")
+        out(f"  GraphQL: {'Normal' if graphql_normal else 'Não Normal'} (p={graphql_p:.4f})")
+        out(f"  REST: {'Normal' if rest_normal else 'Não Normal'} (p={rest_p:.4f})")
         
-        # Teste estatístico
-        # Para comparação pareada, precisamos dos pares
-        paired_differences = []
-        for result in results:
-            # Para cada grupo, calcula diferença média
-            paired_differences.append(result['difference'])
+        # Média das diferenças calculada uma vez (Cohen's d, conclusão e retorno)
+        mean_diff = paired_differences.mean() if len(paired_differences) else 0.0
         
+        # Teste estatístico
         if len(paired_differences) > 1:
             # Teste t pareado ou Wilcoxon
             if graphql_normal and rest_normal:
-                # Teste t pareado
-                t_stat, p_value = ttest_rel(
-                    [r['graphql_mean'] for r in results],
-                    [r['rest_mean'] for r in results]
-                )
+                # Teste t pareado (== teste t de uma amostra sobre as diferenças)
+                t_stat, p_value = ttest_1samp(paired_differences, 0.0)
                 test_name = "Teste t pareado"
             else:
                 # Teste de Wilcoxon
-                t_stat, p_value = wilcoxon(
-                    [r['graphql_mean'] for r in results],
-                    [r['rest_mean'] for r in results],
-                    alternative='two-sided'
-                )
+                t_stat, p_value = wilcoxon(paired_differences, alternative='two-sided')
                 test_name = "Teste de Wilcoxon"
             
-            print(f"\n{test_name}:")
-            print(f"  Estatística: {t_stat:.4f}")
-            print(f"  p-value: {p_value:.4f}")
+            out(f"\n{test_name}:")
+            out(f"  Estatística: {t_stat:.4f}")
+            out(f"  p-value: {p_value:.4f}")
             
-            # Tamanho do efeito (Cohen's d)
-            mean_diff = np.mean(paired_differences)
-            std_diff = np.std(paired_differences)
-            cohens_d = mean_diff / std_diff if std_diff > 0 else 0
+            # Tamanho do efeito (Cohen's d), mesmo ddof=0 do desvio das estatísticas descritivas
+            std_diff = paired_differences.std()
+            cohens_d = mean_diff / std_diff if std_diff > 0 else 0.0
             
-            print(f"  Cohen's d: {cohens_d:.4f}")
+            out(f"  Cohen's d: {cohens_d:.4f}")
             
             # Interpretação
             if p_value < 0.05:
@@ -182,22 +299,25 @@ class ExperimentAnalyzer:
             else:
                 conclusion = "Não há diferença significativa entre GraphQL e REST"
             
-            print(f"  Conclusão: {conclusion}")
+            out(f"  Conclusão: {conclusion}")
         else:
             p_value = 1.0
             conclusion = "Dados insuficientes para análise estatística"
             cohens_d = 0.0
         
-        return {
+        sys.stdout.write('\n'.join(lines) + '\n')
+        
+        self.results['rq1'] = {
             'graphql_stats': graphql_stats,
             'rest_stats': rest_stats,
             'test_name': test_name if len(paired_differences) > 1 else 'N/A',
             'p_value': p_value if len(paired_differences) > 1 else 1.0,
             'cohens_d': cohens_d,
             'conclusion': conclusion,
-            'mean_difference': np.mean(paired_differences) if paired_differences else 0,
-            'graphql_faster': np.mean(paired_differences) < 0 if paired_differences else False
+            'mean_difference': mean_diff,
+            'graphql_faster': mean_diff < 0
         }
+        return self.results['rq1']
     
     def analyze_rq2(self) -> Dict:
         """
@@ -206,104 +326,71 @@ class ExperimentAnalyzer:
         Returns:
             Dict com resultados da análise
         """
-        print("\n" + "="*60)
-        print("ANÁLISE RQ2: Tamanho da Resposta")
-        print("="*60)
+        if 'rq2' in self.results:
+            return self.results['rq2']
         
-        # Agrupa por repositório e tipo de consulta para fazer comparação pareada
-        results = []
+        # Saída acumulada e escrita de uma vez (uma única chamada a sys.stdout.write)
+        lines = []
+        out = lines.append
         
-        for (repo_owner, repo_name, query_type), group in self.df.groupby(['repository_owner', 'repository_name', 'query_type']):
-            graphql_sizes = group[group['api_type'] == 'graphql']['response_size_bytes'].values
-            rest_sizes = group[group['api_type'] == 'rest']['response_size_bytes'].values
-            
-            if len(graphql_sizes) > 0 and len(rest_sizes) > 0:
-                # Calcula médias para comparação pareada
-                graphql_mean = np.mean(graphql_sizes)
-                rest_mean = np.mean(rest_sizes)
-                
-                results.append({
-                    'repository': f"{repo_owner}/{repo_name}",
-                    'query_type': query_type,
-                    'graphql_mean': graphql_mean,
-                    'rest_mean': rest_mean,
-                    'difference': graphql_mean - rest_mean,
-                    'graphql_data': graphql_sizes,
-                    'rest_data': rest_sizes
-                })
+        out("\n" + "="*60)
+        out("ANÁLISE RQ2: Tamanho da Resposta")
+        out("="*60)
+        
+        # Médias pareadas por repositório e tipo de consulta (calculadas em load_data)
+        pivot = self._paired['response_size_bytes'].reindex(columns=['graphql', 'rest']).dropna()
+        paired_differences = pivot['graphql'].to_numpy(copy=False) - pivot['rest'].to_numpy(copy=False)
         
         # Agrega todos os dados para análise geral
-        all_graphql_sizes = self.df[self.df['api_type'] == 'graphql']['response_size_bytes'].values
-        all_rest_sizes = self.df[self.df['api_type'] == 'rest']['response_size_bytes'].values
+        all_graphql_sizes = self._s_g
+        all_rest_sizes = self._s_r
         
         # Estatísticas descritivas
-        graphql_stats = {
-            'mean': np.mean(all_graphql_sizes),
-            'median': np.median(all_graphql_sizes),
-            'std': np.std(all_graphql_sizes),
-            'min': np.min(all_graphql_sizes),
-            'max': np.max(all_graphql_sizes),
-            'count': len(all_graphql_sizes)
-        }
+        graphql_stats = self._describe(all_graphql_sizes)
+        rest_stats = self._describe(all_rest_sizes)
         
-        rest_stats = {
-            'mean': np.mean(all_rest_sizes),
-            'median': np.median(all_rest_sizes),
-            'std': np.std(all_rest_sizes),
-            'min': np.min(all_rest_sizes),
-            'max': np.max(all_rest_sizes),
-            'count': len(all_rest_sizes)
-        }
+        out(f"\nEstatísticas Descritivas - GraphQL:")
+        out(f"  Média: {graphql_stats['mean']:.0f} bytes ({graphql_stats['mean']/1024:.2f} KB)")
+        out(f"  Mediana: {graphql_stats['median']:.0f} bytes ({graphql_stats['median']/1024:.2f} KB)")
+        out(f"  Desvio Padrão: {graphql_stats['std']:.0f} bytes")
         
-        print(f"\nEstatísticas Descritivas - GraphQL:")
-        print(f"  Média: {graphql_stats['mean']:.0f} bytes ({graphql_stats['mean']/1024:.2f} KB)")
-        print(f"  Mediana: {graphql_stats['median']:.0f} bytes ({graphql_stats['median']/1024:.2f} KB)")
-        print(f"  Desvio Padrão: {graphql_stats['std']:.0f} bytes")
-        
-        print(f"\nEstatísticas Descritivas - REST:")
-        print(f"  Média: {rest_stats['mean']:.0f} bytes ({rest_stats['mean']/1024:.2f} KB)")
-        print(f"  Mediana: {rest_stats['median']:.0f} bytes ({rest_stats['median']/1024:.2f} KB)")
-        print(f"  Desvio Padrão: {rest_stats['std']:.0f} bytes")
+        out(f"\nEstatísticas Descritivas - REST:")
+        out(f"  Média: {rest_stats['mean']:.0f} bytes ({rest_stats['mean']/1024:.2f} KB)")
+        out(f"  Mediana: {rest_stats['median']:.0f} bytes ({rest_stats['median']/1024:.2f} KB)")
+        out(f"  Desvio Padrão: {rest_stats['std']:.0f} bytes")
         
         # Teste de normalidade
-        graphql_normal, graphql_p = self.test_normality(pd.Series(all_graphql_sizes))
-        rest_normal, rest_p = self.test_normality(pd.Series(all_rest_sizes))
+        graphql_normal, graphql_p = self.test_normality(all_graphql_sizes)
+        rest_normal, rest_p = self.test_normality(all_rest_sizes)
         
-        print(f"\nTeste de Normalidade:")
-        print(f"  GraphQL: {'Normal' if graphql_normal else 'Não Normal'} (p={graphql_p:.4f})")
-        print(f"  REST: {'Normal' if rest_normal else 'Não Normal'} (p={rest_p:.4f})")
+        out(f"\nTeste de Normalidade:")
+        out(f"  GraphQL: {'Normal' if graphql_normal else 'Não Normal'} (p={graphql_p:.4f})")
+        out(f"  REST: {'Normal' if rest_normal else 'Não Normal'} (p={rest_p:.4f})")
         
-        # Teste estatístico
-        paired_differences = [r['difference'] for r in results]
+        # Média das diferenças calculada uma vez (Cohen's d, conclusão e retorno)
+        mean_diff = paired_differences.mean() if len(paired_differences) else 0.0
         
+        # Teste estatístico
         if len(paired_differences) > 1:
             # Teste t pareado ou Wilcoxon
             if graphql_normal and rest_normal:
-                # Teste t pareado
-                t_stat, p_value = ttest_rel(
-                    [r['graphql_mean'] for r in results],
-                    [r['rest_mean'] for r in results]
-                )
+                # Teste t pareado (== teste t de uma amostra sobre as diferenças)
+                t_stat, p_value = ttest_1samp(paired_differences, 0.0)
                 test_name = "Teste t pareado"
             else:
                 # Teste de Wilcoxon
-                t_stat, p_value = wilcoxon(
-                    [r['graphql_mean'] for r in results],
-                    [r['rest_mean'] for r in results],
-                    alternative='two-sided'
-                )
+                t_stat, p_value = wilcoxon(paired_differences, alternative='two-sided')
                 test_name = "Teste de Wilcoxon"
             
-            print(f"\n{test_name}:")
-            print(f"  Estatística: {t_stat:.4f}")
-            print(f"  p-value: {p_value:.4f}")
+            out(f"\n{test_name}:")
+            out(f"  Estatística: {t_stat:.4f}")
+            out(f"  p-value: {p_value:.4f}")
             
-            # Tamanho do efeito (Cohen's d)
-            mean_diff = np.mean(paired_differences)
-            std_diff = np.std(paired_differences)
-            cohens_d = mean_diff / std_diff if std_diff > 0 else 0
+            # Tamanho do efeito (Cohen's d), mesmo ddof=0 do desvio das estatísticas descritivas
+            std_diff = paired_differences.std()
+            cohens_d = mean_diff / std_diff if std_diff > 0 else 0.0
             
-            print(f"  Cohen's d: {cohens_d:.4f}")
+            out(f"  Cohen's d: {cohens_d:.4f}")
             
             # Interpretação
             if p_value < 0.05:
@@ -314,52 +401,65 @@ class ExperimentAnalyzer:
             else:
                 conclusion = "Não há diferença significativa entre GraphQL e REST"
             
-            print(f"  Conclusão: {conclusion}")
+            out(f"  Conclusão: {conclusion}")
         else:
             p_value = 1.0
             conclusion = "Dados insuficientes para análise estatística"
             cohens_d = 0.0
         
-        return {
+        sys.stdout.write('\n'.join(lines) + '\n')
+        
+        self.results['rq2'] = {
             'graphql_stats': graphql_stats,
             'rest_stats': rest_stats,
             'test_name': test_name if len(paired_differences) > 1 else 'N/A',
             'p_value': p_value if len(paired_differences) > 1 else 1.0,
             'cohens_d': cohens_d,
             'conclusion': conclusion,
-            'mean_difference': np.mean(paired_differences) if paired_differences else 0,
-            'graphql_smaller': np.mean(paired_differences) < 0 if paired_differences else False
+            'mean_difference': mean_diff,
+            'graphql_smaller': mean_diff < 0
         }
+        return self.results['rq2']
     
     def analyze_by_query_type(self) -> Dict:
         """Analisa resultados por tipo de consulta"""
-        print("\n" + "="*60)
-        print("ANÁLISE POR TIPO DE CONSULTA")
-        print("="*60)
+        if 'by_type' in self.results:
+            return self.results['by_type']
+        
+        # Saída acumulada e escrita de uma vez (uma única chamada a sys.stdout.write)
+        lines = []
+        out = lines.append
+        
+        out("\n" + "="*60)
+        out("ANÁLISE POR TIPO DE CONSULTA")
+        out("="*60)
+        
+        # Todas as médias (tipo x API x métrica) em uma única pivot_table
+        pt = self.df.pivot_table(index='query_type', columns='api_type',
+                                 values=['response_time_ms', 'response_size_bytes'],
+                                 aggfunc='mean', observed=True)
+        known = [qt for qt in QUERY_TYPES if qt in pt.index]
+        pt = pt.reindex(index=known + [qt for qt in pt.index if qt not in QUERY_TYPES],
+                        columns=pd.MultiIndex.from_product([['response_time_ms', 'response_size_bytes'], ['graphql', 'rest']]))
+        pt = pt.fillna(0)
         
         results_by_type = {}
         
-        for query_type in ['simple', 'complex', 'multiple']:
-            type_data = self.df[self.df['query_type'] == query_type]
+        for query_type, row in pt.iterrows():
+            results_by_type[query_type] = {
+                'graphql_time_mean': row[('response_time_ms', 'graphql')],
+                'rest_time_mean': row[('response_time_ms', 'rest')],
+                'graphql_size_mean': row[('response_size_bytes', 'graphql')],
+                'rest_size_mean': row[('response_size_bytes', 'rest')],
+            }
             
-            if len(type_data) > 0:
-                graphql_times = type_data[type_data['api_type'] == 'graphql']['response_time_ms'].values
-                rest_times = type_data[type_data['api_type'] == 'rest']['response_time_ms'].values
-                
-                graphql_sizes = type_data[type_data['api_type'] == 'graphql']['response_size_bytes'].values
-                rest_sizes = type_data[type_data['api_type'] == 'rest']['response_size_bytes'].values
-                
-                results_by_type[query_type] = {
-                    'graphql_time_mean': np.mean(graphql_times) if len(graphql_times) > 0 else 0,
-                    'rest_time_mean': np.mean(rest_times) if len(rest_times) > 0 else 0,
-                    'graphql_size_mean': np.mean(graphql_sizes) if len(graphql_sizes) > 0 else 0,
-                    'rest_size_mean': np.mean(rest_sizes) if len(rest_sizes) > 0 else 0,
-                }
-                
-                print(f"\n{query_type.upper()}:")
-                print(f"  Tempo - GraphQL: {results_by_type[query_type]['graphql_time_mean']:.2f} ms, REST: {results_by_type[query_type]['rest_time_mean']:.2f} ms")
-                print(f"  Tamanho - GraphQL: {results_by_type[query_type]['graphql_size_mean']:.0f} bytes, REST: {results_by_type[query_type]['rest_size_mean']:.0f} bytes")
+            out(f"\n{query_type.upper()}:")
+            out(f"  Tempo - GraphQL: {results_by_type[query_type]['graphql_time_mean']:.2f} ms, REST: {results_by_type[query_type]['rest_time_mean']:.2f} ms")
+            out(f"  Tamanho - GraphQL: {results_by_type[query_type]['graphql_size_mean']:.0f} bytes, REST: {results_by_type[query_type]['rest_size_mean']:.0f} bytes")
         
+        sys.stdout.write('\n'.join(lines) + '\n')
+        
+        self.results['by_type'] = results_by_type
         return results_by_type
     
     def generate_summary_report(self) -> str:
@@ -415,17 +515,10 @@ def main():
         print("Erro ao carregar dados. Verifique se o arquivo experiment_data.csv existe.")
         return
     
-    # Executa análises
-    rq1_results = analyzer.analyze_rq1()
-    rq2_results = analyzer.analyze_rq2()
-    by_type = analyzer.analyze_by_query_type()
-    
-    # Salva resultados
-    analyzer.results = {
-        'rq1': rq1_results,
-        'rq2': rq2_results,
-        'by_type': by_type
-    }
+    # Executa análises (resultados ficam em analyzer.results e são reaproveitados no relatório)
+    analyzer.analyze_rq1()
+    analyzer.analyze_rq2()
+    analyzer.analyze_by_query_type()
     
     # Gera relatório
     report = analyzer.generate_summary_report()
@@ -6,21 +6,180 @@ Mede tempo de resposta e tamanho das respostas para ambas as APIs
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import numpy as np
 import time
 import os
 import csv
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import multiprocessing
+from queue import Empty
+import threading
 import random
 
+try:
+    import httpx
+    import h2  # noqa: F401  (necessário para http2=True)
+except ImportError:  # httpx/h2 só são necessários com http2=True (GITHUB_HTTP2=1); padrão: requests (HTTP/1.1)
+    httpx = None
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # orjson é opcional; sem ele usa o json da stdlib
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, allow_nan=False).encode('utf-8')
+    _json_loads = json.loads
+
+try:
+    from requests_cache import CachedSession
+except ImportError:  # requests_cache é opcional; só usado com read_through_cache=True
+    CachedSession = None
+
+# Cache local opcional (read_through_cache=True) e validade das entradas, em segundos
+CACHE_PATH = '.gh_cache.sqlite'
+CACHE_EXPIRE_AFTER = 3600
+
+# Máximo de GETs REST simultâneos na consulta 'multiple'
+REST_MULTIPLE_WORKERS = 8
+
+QUERY_TYPES = ('simple', 'complex', 'multiple')
+API_TYPES = ('graphql', 'rest')
+
+# Medições simultâneas em run_experiment_trial. O padrão é 1 (sequencial): medições
+# sobrepostas disputam conexão e banda, contaminando response_time_ms, e concluem fora
+# da ordem randomizada. Valores maiores (EXPERIMENT_TRIAL_WORKERS) são opt-in e devem
+# ser registrados na metodologia do relatório
+TRIAL_WORKERS = 1
+
+# Abaixo deste saldo de X-RateLimit-Remaining, as medições passam a ser espaçadas
+# para distribuir o saldo até o reset da janela
+RATE_LIMIT_LOW_WATERMARK = 100
+
+# A cada quantas linhas o CSV é descarregado em disco durante o trial
+CSV_FLUSH_EVERY = 100
+
+# Espera máxima (s) por uma medição na fila da coleta multiprocesso antes de verificar
+# se algum processo terminou com erro (um processo morto não envia o sentinela None)
+QUEUE_POLL_TIMEOUT = 5
+
+# Dialeto do CSV de saída: aspas só quando necessário, fim de linha '\n'
+CSV_WRITER_OPTIONS = {'quoting': csv.QUOTE_MINIMAL, 'lineterminator': '\n'}
+
+# Tamanho máximo da mensagem de erro gravada (mantém as linhas do CSV limitadas)
+ERROR_MAX_CHARS = 256
+
+
+@dataclass(slots=True)
+class Measurement:
+    """Uma medição do experimento (campos na ordem das colunas do CSV)"""
+    timestamp: int  # time.time_ns(); formatado em ISO só ao gravar
+    query_type: str
+    api_type: str
+    repository_owner: str
+    repository_name: str
+    response_time_ms: Optional[float] = None
+    response_size_bytes: Optional[int] = None
+    success: bool = False
+    error: Optional[str] = None
+    http_version: Optional[str] = None  # transporte configurado no coletor ('HTTP/1.1' ou 'HTTP/2')
+
+
+CSV_FIELDNAMES = [f.name for f in fields(Measurement)]
+# Campos após o timestamp, extraídos como tupla (sem montar dicts)
+_measurement_values = attrgetter(*CSV_FIELDNAMES[1:])
+
+
+def _measurement_row(measurement: Measurement) -> tuple:
+    """Linha do CSV de uma Measurement, com o timestamp em ISO 8601 (hora local, µs)"""
+    seconds, nanoseconds = divmod(measurement.timestamp, 1_000_000_000)
+    timestamp = datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
+    return (timestamp.isoformat(), *_measurement_values(measurement))
+
+
 class ExperimentCollector:
-    def __init__(self, github_token: str):
+    # Queries parametrizadas: o texto é constante (o servidor pode reaproveitar o parse/validação)
+    # e owner/name/limite vão nas variáveis, sem interpolação na query
+    REPOSITORY_INFO_QUERY = """
+        query($owner: String!, $name: String!) {
+            repository(owner: $owner, name: $name) {
+                name
+                description
+                stargazerCount
+                forkCount
+                watchers {
+                    totalCount
+                }
+                issues {
+                    totalCount
+                }
+                pullRequests {
+                    totalCount
+                }
+                createdAt
+                updatedAt
+                primaryLanguage {
+                    name
+                }
+            }
+        }
+        """
+    
+    REPOSITORY_WITH_ISSUES_QUERY = """
+        query($owner: String!, $name: String!, $first: Int!) {
+            repository(owner: $owner, name: $name) {
+                name
+                description
+                stargazerCount
+                issues(first: $first) {
+                    totalCount
+                    nodes {
+                        number
+                        title
+                        state
+                        createdAt
+                        author {
+                            login
+                        }
+                        comments {
+                            totalCount
+                        }
+                    }
+                }
+            }
+        }
+        """
+    
+    # Um alias da query 'multiple' (i = índice do repositório nas variáveis $o{i}/$n{i})
+    MULTIPLE_ALIAS_TEMPLATE = """
+            repo{i}: repository(owner: $o{i}, name: $n{i}) {{
+                name
+                description
+                stargazerCount
+                forkCount
+                primaryLanguage {{
+                    name
+                }}
+            }}
+            """
+    
+    def __init__(self, github_token: str, read_through_cache: bool = False, http2: bool = False):
         """
         Inicializa o coletor de dados do experimento
         
         Args:
             github_token: Token de acesso do GitHub
+            read_through_cache: Serve réplicas repetidas de um cache SQLite local
+                (apenas para aquecimento/depuração; distorce as medições)
+            http2: Usa httpx com HTTP/2 em vez de requests (HTTP/1.1); opt-in, pois muda o
+                transporte medido. O protocolo usado é registrado em cada medição (http_version)
         """
         self.token = github_token
         self.graphql_url = "https://api.github.com/graphql"
@@ -35,35 +194,156 @@ class ExperimentCollector:
             "Authorization": f"Bearer {github_token}",
             "Accept": "application/vnd.github.v3+json"
         }
+        
+        # Cliente único: reaproveita conexões keep-alive (sem novo handshake TCP/TLS por medição).
+        # Só falhas de conexão são repetidas; repetir por status (429/5xx) distorceria o tempo medido.
+        self.read_through_cache = read_through_cache and CachedSession is not None
+        if read_through_cache and CachedSession is None:
+            print("AVISO: requests_cache não instalado; coletando sem cache")
+        if http2 and httpx is None:
+            print("AVISO: httpx/h2 não instalados; coletando com HTTP/1.1")
+        if self.read_through_cache:
+            # Respostas idênticas (e revalidadas via ETag) não voltam à rede
+            self.session = CachedSession(CACHE_PATH, backend='sqlite', expire_after=CACHE_EXPIRE_AFTER,
+                                         allowable_methods=('GET', 'POST'))
+        elif http2 and httpx is not None:
+            # HTTP/2: as requisições simultâneas são multiplexadas em uma única conexão TLS
+            self.session = httpx.Client(follow_redirects=True, transport=httpx.HTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            ))
+        else:
+            self.session = requests.Session()
+        if isinstance(self.session, requests.Session):
+            self.session.mount("https://", HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=32,
+                max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.3)
+            ))
+        
+        # Body já serializado: httpx recebe bytes em content=, requests em data=
+        self._body_kwarg = 'data' if isinstance(self.session, requests.Session) else 'content'
+        self.http_version = 'HTTP/1.1' if isinstance(self.session, requests.Session) else 'HTTP/2'
+        print(f"Protocolo HTTP: {self.http_version}")
+        
+        # Pool para disparar os GETs da consulta REST 'multiple' em paralelo
+        self._rest_pool = ThreadPoolExecutor(max_workers=REST_MULTIPLE_WORKERS)
+        
+        # Espaçamento global entre medições, compartilhado pelas threads do trial
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+        self._request_interval = 0.0  # ajustado por _update_rate_limit
+        
+        # Queries/endpoints já montados: são idênticos nas réplicas de cada combinação
+        self._request_cache = {}
+    
+    def close(self):
+        """Encerra o pool da consulta REST 'multiple' e as conexões da sessão HTTP"""
+        self._rest_pool.shutdown(wait=True)
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _cached_request(self, builder, *args):
+        """Resultado memoizado de um gerador de query/endpoint (argumentos devem ser hashable)"""
+        key = (builder.__name__, *args)
+        request = self._request_cache.get(key)
+        if request is None:
+            request = self._request_cache[key] = builder(*args)
+        return request
     
-    def measure_graphql_query(self, query: str, variables: Optional[Dict] = None) -> Tuple[float, int, Dict]:
+    def _wait_turn(self):
+        """Bloqueia até o próximo horário livre, respeitando o intervalo atual entre medições"""
+        with self._rate_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at)
+            self._next_request_at = start_at + self._request_interval
+        if start_at > now:
+            time.sleep(start_at - now)
+    
+    def _update_rate_limit(self, response):
+        """
+        Ajusta o espaçamento entre medições a partir dos headers de rate limit do GitHub
+        
+        Sem pausa enquanto há saldo; com saldo baixo, espaça as medições até o reset.
+        Em 403/429 com Retry-After, suspende novas medições pelo tempo indicado.
+        (GraphQL e REST têm saldos separados; o espaçamento é compartilhado, por segurança.)
+        """
+        headers = response.headers
+        retry_after = headers.get("Retry-After")
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        
+        with self._rate_lock:
+            if retry_after is not None and response.status_code in (403, 429):
+                self._next_request_at = max(self._next_request_at, time.monotonic() + float(retry_after))
+            if remaining is not None and reset is not None:
+                remaining = int(remaining)
+                if remaining < RATE_LIMIT_LOW_WATERMARK:
+                    window = max(int(reset) - time.time(), 0.0)
+                    self._request_interval = window / max(remaining, 1)
+                else:
+                    self._request_interval = 0.0
+    
+    def _collect_paced(self, query_type: str, api_type: str, owner: str, name: str,
+                       additional_params: Optional[Dict]) -> Measurement:
+        """collect_measurement precedido da espera pelo limitador de taxa"""
+        self._wait_turn()
+        return self.collect_measurement(query_type, api_type, owner, name, additional_params)
+    
+    @staticmethod
+    def _response_size(response) -> int:
+        """
+        Tamanho da resposta (headers + body) sem copiar o body nem serializar os headers
+        
+        O body é sempre o conteúdo já descomprimido (len(response.content)), a mesma unidade
+        para toda resposta e API; Content-Length não é usado porque, com gzip, traz o tamanho
+        comprimido. Headers: "nome: valor\r\n" por linha, somados a cada resposta (variam
+        entre respostas, p.ex. Date, ETag e X-RateLimit-*).
+        """
+        header_size = sum(len(k) + len(v) + 4 for k, v in response.headers.items())
+        return len(response.content) + header_size
+    
+    def measure_graphql_query(self, query: str, variables: Optional[Dict] = None,
+                              keep_body: bool = False) -> Tuple[float, int, Optional[Dict]]:
         """
         Executa uma query GraphQL e mede tempo e tamanho da resposta
         
+        Args:
+            keep_body: Decodifica o JSON da resposta (desligado: as medições só usam tempo/tamanho)
+        
         Returns:
-            Tuple: (tempo_ms, tamanho_bytes, dados_resposta)
+            Tuple: (tempo_ms, tamanho_bytes, dados_resposta ou None)
         """
         payload = {"query": query}
         if variables:
             payload["variables"] = variables
+        # Serializa antes de iniciar o cronômetro (Content-Type já está em graphql_headers)
+        body = _json_dumps(payload)
         
         start_time = time.perf_counter()
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.graphql_url,
                 headers=self.graphql_headers,
-                json=payload,
-                timeout=30
+                timeout=30,
+                **{self._body_kwarg: body}
             )
             
             end_time = time.perf_counter()
             elapsed_ms = (end_time - start_time) * 1000
+            self._update_rate_limit(response)
             
             # Tamanho da resposta (headers + body)
-            response_size = len(response.content) + len(str(response.headers))
+            response_size = self._response_size(response)
             
-            response_data = response.json() if response.status_code == 200 else None
+            response_data = _json_loads(response.content) if keep_body and response.status_code == 200 else None
             
             return elapsed_ms, response_size, response_data
             
@@ -71,19 +351,23 @@ class ExperimentCollector:
             print(f"Erro na query GraphQL: {e}")
             return None, None, None
     
-    def measure_rest_request(self, endpoint: str, params: Optional[Dict] = None) -> Tuple[float, int, Dict]:
+    def measure_rest_request(self, endpoint: str, params: Optional[Dict] = None,
+                             keep_body: bool = False) -> Tuple[float, int, Optional[Dict]]:
         """
         Executa uma requisição REST e mede tempo e tamanho da resposta
         
+        Args:
+            keep_body: Decodifica o JSON da resposta (desligado: as medições só usam tempo/tamanho)
+        
         Returns:
-            Tuple: (tempo_ms, tamanho_bytes, dados_resposta)
+            Tuple: (tempo_ms, tamanho_bytes, dados_resposta ou None)
         """
         url = f"{self.rest_base_url}{endpoint}"
         
         start_time = time.perf_counter()
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 url,
                 headers=self.rest_headers,
                 params=params,
@@ -92,11 +376,12 @@ class ExperimentCollector:
             
             end_time = time.perf_counter()
             elapsed_ms = (end_time - start_time) * 1000
+            self._update_rate_limit(response)
             
             # Tamanho da resposta (headers + body)
-            response_size = len(response.content) + len(str(response.headers))
+            response_size = self._response_size(response)
             
-            response_data = response.json() if response.status_code == 200 else None
+            response_data = _json_loads(response.content) if keep_body and response.status_code == 200 else None
             
             return elapsed_ms, response_size, response_data
             
@@ -104,66 +389,18 @@ class ExperimentCollector:
             print(f"Erro na requisição REST: {e}")
             return None, None, None
     
-    def get_repository_info_graphql(self, owner: str, name: str) -> str:
-        """Gera query GraphQL para obter informações básicas do repositório"""
-        query = f"""
-        query {{
-            repository(owner: "{owner}", name: "{name}") {{
-                name
-                description
-                stargazerCount
-                forkCount
-                watchers {{
-                    totalCount
-                }}
-                issues {{
-                    totalCount
-                }}
-                pullRequests {{
-                    totalCount
-                }}
-                createdAt
-                updatedAt
-                primaryLanguage {{
-                    name
-                }}
-            }}
-        }}
-        """
-        return query
+    def get_repository_info_graphql(self, owner: str, name: str) -> Tuple[str, Dict]:
+        """Gera query GraphQL (constante) e variáveis para obter informações básicas do repositório"""
+        return self.REPOSITORY_INFO_QUERY, {"owner": owner, "name": name}
     
     def get_repository_info_rest(self, owner: str, name: str) -> Tuple[str, Dict]:
         """Gera endpoint REST para obter informações básicas do repositório"""
         endpoint = f"/repos/{owner}/{name}"
         return endpoint, {}
     
-    def get_repository_with_issues_graphql(self, owner: str, name: str, limit: int = 10) -> str:
-        """Gera query GraphQL para obter repositório com issues"""
-        query = f"""
-        query {{
-            repository(owner: "{owner}", name: "{name}") {{
-                name
-                description
-                stargazerCount
-                issues(first: {limit}) {{
-                    totalCount
-                    nodes {{
-                        number
-                        title
-                        state
-                        createdAt
-                        author {{
-                            login
-                        }}
-                        comments {{
-                            totalCount
-                        }}
-                    }}
-                }}
-            }}
-        }}
-        """
-        return query
+    def get_repository_with_issues_graphql(self, owner: str, name: str, limit: int = 10) -> Tuple[str, Dict]:
+        """Gera query GraphQL (constante) e variáveis para obter repositório com issues"""
+        return self.REPOSITORY_WITH_ISSUES_QUERY, {"owner": owner, "name": name, "first": limit}
     
     def get_repository_with_issues_rest(self, owner: str, name: str, limit: int = 10) -> Tuple[str, Dict]:
         """Gera endpoint REST para obter repositório com issues"""
@@ -172,25 +409,17 @@ class ExperimentCollector:
         params = {"per_page": limit, "state": "all"}
         return issues_endpoint, params
     
-    def get_multiple_repositories_graphql(self, repos: List[Tuple[str, str]]) -> str:
-        """Gera query GraphQL para obter múltiplos repositórios"""
-        aliases = []
+    def get_multiple_repositories_graphql(self, repos: List[Tuple[str, str]]) -> Tuple[str, Dict]:
+        """Gera query GraphQL e variáveis para obter múltiplos repositórios (um alias por repositório)"""
+        indices = range(len(repos))
+        declarations = ", ".join(f"$o{i}: String!, $n{i}: String!" for i in indices)
+        aliases = "".join(self.MULTIPLE_ALIAS_TEMPLATE.format(i=i) for i in indices)
+        variables = {}
         for i, (owner, name) in enumerate(repos):
-            alias = f"repo{i}"
-            aliases.append(f"""
-            {alias}: repository(owner: "{owner}", name: "{name}") {{
-                name
-                description
-                stargazerCount
-                forkCount
-                primaryLanguage {{
-                    name
-                }}
-            }}
-            """)
+            variables[f"o{i}"] = owner
+            variables[f"n{i}"] = name
         
-        query = f"query {{ {''.join(aliases)} }}"
-        return query
+        return f"query({declarations}) {{ {aliases} }}", variables
     
     def get_multiple_repositories_rest(self, repos: List[Tuple[str, str]]) -> List[Tuple[str, Dict]]:
         """Gera endpoints REST para obter múltiplos repositórios"""
@@ -202,7 +431,7 @@ class ExperimentCollector:
     
     def collect_measurement(self, query_type: str, api_type: str, 
                            owner: str, name: str, 
-                           additional_params: Optional[Dict] = None) -> Dict:
+                           additional_params: Optional[Dict] = None) -> Measurement:
         """
         Coleta uma medição para um tipo de consulta específico
         
@@ -214,103 +443,107 @@ class ExperimentCollector:
             additional_params: Parâmetros adicionais (ex: limit para issues)
         
         Returns:
-            Dict com os dados da medição
+            Measurement com os dados da medição
         """
-        measurement = {
-            'timestamp': datetime.now().isoformat(),
-            'query_type': query_type,
-            'api_type': api_type,
-            'repository_owner': owner,
-            'repository_name': name,
-            'response_time_ms': None,
-            'response_size_bytes': None,
-            'success': False,
-            'error': None
-        }
+        measurement = Measurement(time.time_ns(), query_type, api_type, owner, name,
+                                  http_version=self.http_version)
         
         try:
             if api_type == 'graphql':
                 if query_type == 'simple':
-                    query = self.get_repository_info_graphql(owner, name)
-                    time_ms, size_bytes, data = self.measure_graphql_query(query)
+                    query, variables = self._cached_request(self.get_repository_info_graphql, owner, name)
+                    time_ms, size_bytes, _ = self.measure_graphql_query(query, variables)
                 elif query_type == 'complex':
                     limit = additional_params.get('limit', 10) if additional_params else 10
-                    query = self.get_repository_with_issues_graphql(owner, name, limit)
-                    time_ms, size_bytes, data = self.measure_graphql_query(query)
+                    query, variables = self._cached_request(self.get_repository_with_issues_graphql, owner, name, limit)
+                    time_ms, size_bytes, _ = self.measure_graphql_query(query, variables)
                 elif query_type == 'multiple':
                     repos = additional_params.get('repos', [(owner, name)]) if additional_params else [(owner, name)]
-                    query = self.get_multiple_repositories_graphql(repos)
-                    time_ms, size_bytes, data = self.measure_graphql_query(query)
+                    query, variables = self._cached_request(self.get_multiple_repositories_graphql, tuple(repos))
+                    time_ms, size_bytes, _ = self.measure_graphql_query(query, variables)
                 else:
                     raise ValueError(f"Tipo de consulta desconhecido: {query_type}")
             
             elif api_type == 'rest':
                 if query_type == 'simple':
-                    endpoint, params = self.get_repository_info_rest(owner, name)
-                    time_ms, size_bytes, data = self.measure_rest_request(endpoint, params)
+                    endpoint, params = self._cached_request(self.get_repository_info_rest, owner, name)
+                    time_ms, size_bytes, _ = self.measure_rest_request(endpoint, params)
                 elif query_type == 'complex':
                     limit = additional_params.get('limit', 10) if additional_params else 10
-                    endpoint, params = self.get_repository_with_issues_rest(owner, name, limit)
-                    time_ms, size_bytes, data = self.measure_rest_request(endpoint, params)
+                    endpoint, params = self._cached_request(self.get_repository_with_issues_rest, owner, name, limit)
+                    time_ms, size_bytes, _ = self.measure_rest_request(endpoint, params)
                 elif query_type == 'multiple':
                     repos = additional_params.get('repos', [(owner, name)]) if additional_params else [(owner, name)]
-                    endpoints = self.get_multiple_repositories_rest(repos)
-                    # Para REST, precisamos fazer múltiplas requisições
-                    total_time = 0
-                    total_size = 0
-                    all_data = []
-                    for endpoint, params in endpoints:
-                        t, s, d = self.measure_rest_request(endpoint, params)
-                        if t is not None:
-                            total_time += t
-                            total_size += s
-                            all_data.append(d)
-                    time_ms = total_time
-                    size_bytes = total_size
-                    data = all_data
+                    endpoints = self._cached_request(self.get_multiple_repositories_rest, tuple(repos))
+                    # Para REST, precisamos fazer múltiplas requisições: disparadas em paralelo,
+                    # o tempo medido é o de parede do lote (máx. tᵢ, não Σtᵢ)
+                    start_time = time.perf_counter()
+                    results = list(self._rest_pool.map(lambda e: self.measure_rest_request(*e), endpoints))
+                    elapsed_ms = (time.perf_counter() - start_time) * 1000
+                    
+                    ok = [s for t, s, _ in results if t is not None]
+                    time_ms = elapsed_ms if ok else None
+                    size_bytes = sum(ok)
                 else:
                     raise ValueError(f"Tipo de consulta desconhecido: {query_type}")
             else:
                 raise ValueError(f"Tipo de API desconhecido: {api_type}")
             
             if time_ms is not None and size_bytes is not None:
-                measurement['response_time_ms'] = time_ms
-                measurement['response_size_bytes'] = size_bytes
-                measurement['success'] = True
+                measurement.response_time_ms = time_ms
+                measurement.response_size_bytes = size_bytes
+                measurement.success = True
             else:
-                measurement['error'] = "Falha na requisição"
+                measurement.error = "Falha na requisição"
         
         except Exception as e:
-            measurement['error'] = str(e)
+            measurement.error = repr(e)[:ERROR_MAX_CHARS]
         
         return measurement
     
     def run_experiment_trial(self, repositories: List[Tuple[str, str]], 
-                            num_replicas: int = 30) -> List[Dict]:
+                            num_replicas: int = 30,
+                            filename: str = "experiment_data.csv",
+                            workers: int = TRIAL_WORKERS) -> Dict[str, Dict[str, List[float]]]:
         """
-        Executa um trial completo do experimento
+        Executa um trial completo do experimento, gravando cada medição no CSV assim que concluída
         
         Args:
             repositories: Lista de tuplas (owner, name) de repositórios
             num_replicas: Número de réplicas por combinação
+            filename: Arquivo CSV de saída
+            workers: Medições simultâneas (1 = sequencial, na ordem randomizada)
         
         Returns:
-            Lista com todas as medições coletadas
+            Tempos e tamanhos das medições bem-sucedidas por API:
+            {'graphql': {'times': [...], 'sizes': [...]}, 'rest': {...}}
         """
-        all_measurements = []
-        query_types = ['simple', 'complex', 'multiple']
-        api_types = ['graphql', 'rest']
-        
-        total_combinations = len(repositories) * len(query_types) * len(api_types) * num_replicas
-        current = 0
+        total_combinations = len(repositories) * len(QUERY_TYPES) * len(API_TYPES) * num_replicas
         
         print(f"Iniciando experimento com {len(repositories)} repositórios")
         print(f"Total de medições: {total_combinations}")
         
+        measurements = self.iter_trial_measurements(repositories, num_replicas, repositories[:3], workers)
+        return _stream_to_csv(measurements, filename, total_combinations)
+    
+    def iter_trial_measurements(self, repositories: List[Tuple[str, str]], num_replicas: int,
+                                multiple_repos: List[Tuple[str, str]],
+                                workers: int = TRIAL_WORKERS) -> Iterator[Measurement]:
+        """
+        Gera as medições do trial à medida que são concluídas
+        
+        Args:
+            repositories: Repositórios medidos
+            num_replicas: Número de réplicas por combinação
+            multiple_repos: Repositórios usados na consulta 'multiple'
+            workers: Medições simultâneas (1 = sequencial, na ordem randomizada)
+        """
+        # Monta a lista de medições na ordem do experimento (tratamentos randomizados)
+        tasks = []
         for owner, name in repositories:
-            for query_type in query_types:
+            for query_type in QUERY_TYPES:
                 # Randomiza ordem dos tratamentos
-                api_order = ['graphql', 'rest']
+                api_order = list(API_TYPES)
                 random.shuffle(api_order)
                 
                 for api_type in api_order:
@@ -318,47 +551,149 @@ class ExperimentCollector:
                     if query_type == 'complex':
                         additional_params = {'limit': 10}
                     elif query_type == 'multiple':
-                        # Para múltiplos repositórios, usa os primeiros 3
-                        additional_params = {'repos': repositories[:3]}
+                        additional_params = {'repos': multiple_repos}
                     
                     for replica in range(num_replicas):
-                        current += 1
-                        if current % 50 == 0:
-                            print(f"Progresso: {current}/{total_combinations} ({current/total_combinations*100:.1f}%)")
-                        
-                        measurement = self.collect_measurement(
-                            query_type, api_type, owner, name, additional_params
-                        )
-                        all_measurements.append(measurement)
-                        
-                        # Pequena pausa para evitar rate limiting
-                        time.sleep(0.1)
-        
-        print(f"Experimento concluído! Total de medições: {len(all_measurements)}")
-        return all_measurements
-    
-    def save_measurements(self, measurements: List[Dict], filename: str = "experiment_data.csv"):
+                        tasks.append((query_type, api_type, owner, name, additional_params))
+        
+        if workers <= 1:
+            for task in tasks:
+                yield self._collect_paced(*task)
+            return
+        
+        # Réplicas em paralelo (opt-in): sobrepõe a espera de rede, com o ritmo controlado
+        # por _wait_turn, ao custo de medições concorrentes
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self._collect_paced, *task) for task in tasks}
+            for future in as_completed(futures):
+                futures.discard(future)
+                yield future.result()
+    
+    def save_measurements(self, measurements: List[Measurement], filename: str = "experiment_data.csv"):
         """Salva as medições em arquivo CSV"""
         if not measurements:
             print("Nenhuma medição para salvar")
             return
         
-        fieldnames = [
-            'timestamp', 'query_type', 'api_type', 'repository_owner', 
-            'repository_name', 'response_time_ms', 'response_size_bytes', 
-            'success', 'error'
-        ]
-        
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for measurement in measurements:
-                writer.writerow(measurement)
+            writer = csv.writer(csvfile, **CSV_WRITER_OPTIONS)
+            writer.writerow(CSV_FIELDNAMES)
+            writer.writerows(map(_measurement_row, measurements))
         
         print(f"Medições salvas em {filename}")
         print(f"Total de medições: {len(measurements)}")
-        print(f"Medições bem-sucedidas: {sum(1 for m in measurements if m['success'])}")
+        print(f"Medições bem-sucedidas: {sum(1 for m in measurements if m.success)}")
+
+
+# Percentis exibidos no resumo preliminar (além da mediana)
+SUMMARY_PERCENTILES = [5, 25, 75, 95]
+
+
+def _stream_to_csv(measurements: Iterable[Measurement], filename: str,
+                   total: int) -> Dict[str, Dict[str, List[float]]]:
+    """
+    Grava as medições no CSV à medida que chegam (sem lista em memória; resultados
+    parciais sobrevivem a falhas) e guarda tempos/tamanhos das bem-sucedidas por API
+    """
+    metrics = {api_type: {'times': [], 'sizes': []} for api_type in API_TYPES}
+    successful = 0
+    
+    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile, **CSV_WRITER_OPTIONS)
+        writer.writerow(CSV_FIELDNAMES)
+        
+        for current, measurement in enumerate(measurements, 1):
+            writer.writerow(_measurement_row(measurement))
+            if measurement.success:
+                successful += 1
+                metrics[measurement.api_type]['times'].append(measurement.response_time_ms)
+                metrics[measurement.api_type]['sizes'].append(measurement.response_size_bytes)
+            
+            if current % CSV_FLUSH_EVERY == 0:
+                csvfile.flush()
+            if current % 50 == 0:
+                print(f"Progresso: {current}/{total} ({current/total*100:.1f}%)")
+    
+    print(f"Experimento concluído! Total de medições: {total}")
+    print(f"Medições salvas em {filename}")
+    print(f"Medições bem-sucedidas: {successful}")
+    return metrics
+
+
+def _trial_worker(token: str, repositories: List[Tuple[str, str]], multiple_repos: List[Tuple[str, str]],
+                  num_replicas: int, queue, workers: int = TRIAL_WORKERS, http2: bool = False) -> None:
+    """Processo de coleta: um coletor (sessão + token) próprio, medições enviadas pela fila"""
+    random.seed()  # processos criados por fork herdariam o mesmo estado (mesmos sorteios)
+    try:
+        with ExperimentCollector(token, http2=http2) as collector:
+            for measurement in collector.iter_trial_measurements(repositories, num_replicas, multiple_repos,
+                                                                  workers):
+                queue.put(measurement)
+    finally:
+        queue.put(None)  # fim deste processo (também em caso de erro)
+
+
+def run_experiment_multiprocess(tokens: List[str], repositories: List[Tuple[str, str]],
+                                num_replicas: int = 30,
+                                filename: str = "experiment_data.csv",
+                                workers: int = TRIAL_WORKERS,
+                                http2: bool = False) -> Dict[str, Dict[str, List[float]]]:
+    """
+    Executa o trial dividindo os repositórios entre processos, um por token
+    
+    Cada processo tem seu próprio coletor (e saldo de rate limit); um único escritor
+    no processo principal consome a fila e grava o CSV. Os processos medem em paralelo
+    entre si (assim como workers > 1 dentro de cada um), portanto é uma execução opt-in
+    que deve ser registrada na metodologia.
+    
+    Returns:
+        Mesmo formato de ExperimentCollector.run_experiment_trial
+    """
+    slices = [part for part in (repositories[i::len(tokens)] for i in range(len(tokens))) if part]
+    total_combinations = len(repositories) * len(QUERY_TYPES) * len(API_TYPES) * num_replicas
+    
+    print(f"Iniciando experimento com {len(repositories)} repositórios em {len(slices)} processos")
+    print(f"Total de medições: {total_combinations}")
+    
+    with multiprocessing.Manager() as manager, ProcessPoolExecutor(max_workers=len(slices)) as executor:
+        queue = manager.Queue()
+        futures = [
+            executor.submit(_trial_worker, token, part, repositories[:3], num_replicas, queue, workers, http2)
+            for token, part in zip(tokens, slices)
+        ]
+        
+        def drain() -> Iterator[Measurement]:
+            finished = 0
+            while finished < len(futures):
+                try:
+                    measurement = queue.get(timeout=QUEUE_POLL_TIMEOUT)
+                except Empty:
+                    # Fila parada: propaga a falha de um processo que morreu sem enviar o None
+                    for future in futures:
+                        if future.done() and future.exception() is not None:
+                            raise future.exception()
+                    continue
+                if measurement is None:
+                    finished += 1
+                else:
+                    yield measurement
+        
+        metrics = _stream_to_csv(drain(), filename, total_combinations)
+        for future in futures:
+            future.result()  # propaga erros dos processos
+    return metrics
+
+
+def _summary_stats(values: List[float]) -> Tuple[float, float, np.ndarray]:
+    """
+    Média, mediana e SUMMARY_PERCENTILES em um array contíguo
+    
+    method='higher' devolve sempre um elemento observado; para p=50 é o elemento
+    n//2, como sorted(values)[n//2]. Todos os percentis saem de uma única partição.
+    """
+    a = np.asarray(values, dtype=np.float64)
+    percentiles = np.percentile(a, [50, *SUMMARY_PERCENTILES], method='higher')
+    return a.mean(), percentiles[0], percentiles[1:]
 
 
 def get_popular_repositories(limit: int = 20) -> List[Tuple[str, str]]:
@@ -394,18 +729,17 @@ def get_popular_repositories(limit: int = 20) -> List[Tuple[str, str]]:
 
 def main():
     """Função principal"""
-    # Carrega token do GitHub
+    # Carrega token(s) do GitHub; com vários em GITHUB_TOKENS (separados por vírgula),
+    # a coleta é dividida entre processos, um por token
+    tokens = [t.strip() for t in os.getenv('GITHUB_TOKENS', '').split(',') if t.strip()]
     token = os.getenv('GITHUB_TOKEN')
     
-    if not token:
+    if not token and not tokens:
         print("ERRO: Token do GitHub não encontrado!")
         print("Configure a variável de ambiente GITHUB_TOKEN")
         print("Exemplo: set GITHUB_TOKEN=seu_token_aqui")
         return
     
-    # Cria coletor
-    collector = ExperimentCollector(token)
-    
     # Obtém repositórios populares
     repositories = get_popular_repositories(limit=20)
     
@@ -414,31 +748,44 @@ def main():
         print(f"  - {owner}/{name}")
     print("  ...")
     
-    # Executa experimento
-    measurements = collector.run_experiment_trial(repositories, num_replicas=30)
+    # Medições simultâneas: sequencial por padrão; EXPERIMENT_TRIAL_WORKERS > 1 é opt-in
+    workers = int(os.getenv('EXPERIMENT_TRIAL_WORKERS', TRIAL_WORKERS))
+    # GITHUB_HTTP2=1 troca o transporte para HTTP/2 (httpx); registrado na coluna http_version do CSV
+    http2 = os.getenv('GITHUB_HTTP2') == '1'
     
-    # Salva resultados
-    collector.save_measurements(measurements, "experiment_data.csv")
+    # Executa experimento (as medições são salvas no CSV durante a coleta)
+    if len(tokens) > 1:
+        metrics = run_experiment_multiprocess(tokens, repositories, num_replicas=30,
+                                              filename="experiment_data.csv", workers=workers, http2=http2)
+    else:
+        # GITHUB_READ_CACHE=1 habilita o cache local (execuções de depuração)
+        with ExperimentCollector(tokens[0] if tokens else token,
+                                 read_through_cache=os.getenv('GITHUB_READ_CACHE') == '1',
+                                 http2=http2) as collector:
+            metrics = collector.run_experiment_trial(repositories, num_replicas=30,
+                                                     filename="experiment_data.csv", workers=workers)
     
     # Estatísticas básicas
-    successful = [m for m in measurements if m['success']]
-    if successful:
-        graphql_times = [m['response_time_ms'] for m in successful if m['api_type'] == 'graphql']
-        rest_times = [m['response_time_ms'] for m in successful if m['api_type'] == 'rest']
+    if metrics['graphql']['times'] or metrics['rest']['times']:
+        graphql_times = metrics['graphql']['times']
+        rest_times = metrics['rest']['times']
         
-        graphql_sizes = [m['response_size_bytes'] for m in successful if m['api_type'] == 'graphql']
-        rest_sizes = [m['response_size_bytes'] for m in successful if m['api_type'] == 'rest']
+        graphql_sizes = metrics['graphql']['sizes']
+        rest_sizes = metrics['rest']['sizes']
         
         print("\n" + "="*60)
         print("ESTATÍSTICAS PRELIMINARES")
         print("="*60)
-        print(f"\nTempo de Resposta (ms):")
-        print(f"  GraphQL - Média: {sum(graphql_times)/len(graphql_times):.2f}, Mediana: {sorted(graphql_times)[len(graphql_times)//2]:.2f}")
-        print(f"  REST    - Média: {sum(rest_times)/len(rest_times):.2f}, Mediana: {sorted(rest_times)[len(rest_times)//2]:.2f}")
-        
-        print(f"\nTamanho da Resposta (bytes):")
-        print(f"  GraphQL - Média: {sum(graphql_sizes)/len(graphql_sizes):.0f}, Mediana: {sorted(graphql_sizes)[len(graphql_sizes)//2]:.0f}")
-        print(f"  REST    - Média: {sum(rest_sizes)/len(rest_sizes):.0f}, Mediana: {sorted(rest_sizes)[len(rest_sizes)//2]:.0f}")
+        labels = "/".join(f"P{p}" for p in SUMMARY_PERCENTILES)
+        for title, fmt, graphql_values, rest_values in (
+            ("Tempo de Resposta (ms)", ".2f", graphql_times, rest_times),
+            ("Tamanho da Resposta (bytes)", ".0f", graphql_sizes, rest_sizes),
+        ):
+            print(f"\n{title}:")
+            for api_label, values in (("GraphQL", graphql_values), ("REST   ", rest_values)):
+                mean, median, percentiles = _summary_stats(values)
+                print(f"  {api_label} - Média: {mean:{fmt}}, Mediana: {median:{fmt}}, "
+                      f"{labels}: {' / '.join(f'{p:{fmt}}' for p in percentiles)}")
 
 
 if __name__ == "__main__":
@@ -8,373 +8,234 @@ Baseado no modelo de relatório de laboratório e nos dados experimentais coleta
 import pandas as pd
 import numpy as np
 from datetime import datetime
+import matplotlib
+matplotlib.use('Agg')  # geração apenas em arquivo, sem backend interativo
 import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
 import base64
 import io
-from scipy import stats
-from scipy.stats import shapiro, wilcoxon, ttest_rel
+import hashlib
+import os
+import gzip
+import re
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+from scipy.stats import shapiro, normaltest, wilcoxon, ttest_rel
 import warnings
 warnings.filterwarnings('ignore')
 
-class GraphQLvsRESTReportGenerator:
-    def __init__(self, csv_file="experiment_data.csv"):
-        """Inicializa o gerador de relatório"""
-        self.csv_file = csv_file
-        self.df = None
-        self.analysis_results = {}
-
-    def load_data(self):
-        """Carrega e processa os dados do CSV"""
-        try:
-            self.df = pd.read_csv(self.csv_file)
-            print(f"Dados carregados: {len(self.df)} medições")
-
-            # Filtra apenas medições bem-sucedidas
-            self.df = self.df[self.df['success'] == True].copy()
-            print(f"Medições bem-sucedidas: {len(self.df)}")
-
-            # Converte tipos
-            self.df['response_time_ms'] = pd.to_numeric(self.df['response_time_ms'], errors='coerce')
-            self.df['response_size_bytes'] = pd.to_numeric(self.df['response_size_bytes'], errors='coerce')
-
-            return True
-        except Exception as e:
-            print(f"Erro ao carregar dados: {e}")
-            return False
-
-    def test_normality(self, data: pd.Series):
-        """Testa normalidade dos dados usando Shapiro-Wilk"""
-        if len(data) < 3:
-            return False, 1.0
-
-        sample = data.sample(min(5000, len(data))) if len(data) > 5000 else data
-
-        try:
-            stat, p_value = shapiro(sample)
-            is_normal = p_value > 0.05
-            return is_normal, p_value
-        except:
-            return False, 0.0
-
-    def analyze_rq1(self):
-        """Analisa RQ1: Tempo de Resposta"""
-        results = []
-
-        for (repo_owner, repo_name, query_type), group in self.df.groupby(['repository_owner', 'repository_name', 'query_type']):
-            graphql_times = group[group['api_type'] == 'graphql']['response_time_ms'].values
-            rest_times = group[group['api_type'] == 'rest']['response_time_ms'].values
-
-            if len(graphql_times) > 0 and len(rest_times) > 0:
-                results.append({
-                    'repository': f"{repo_owner}/{repo_name}",
-                    'query_type': query_type,
-                    'graphql_mean': np.mean(graphql_times),
-                    'rest_mean': np.mean(rest_times),
-                    'difference': np.mean(graphql_times) - np.mean(rest_times)
-                })
-
-        all_graphql_times = self.df[self.df['api_type'] == 'graphql']['response_time_ms'].values
-        all_rest_times = self.df[self.df['api_type'] == 'rest']['response_time_ms'].values
-
-        graphql_stats = {
-            'mean': np.mean(all_graphql_times),
-            'median': np.median(all_graphql_times),
-            'std': np.std(all_graphql_times),
-            'min': np.min(all_graphql_times),
-            'max': np.max(all_graphql_times),
-            'count': len(all_graphql_times)
-        }
-
-        rest_stats = {
-            'mean': np.mean(all_rest_times),
-            'median': np.median(all_rest_times),
-            'std': np.std(all_rest_times),
-            'min': np.min(all_rest_times),
-            'max': np.max(all_rest_times),
-            'count': len(all_rest_times)
-        }
-
-        graphql_normal, graphql_p = self.test_normality(pd.Series(all_graphql_times))
-        rest_normal, rest_p = self.test_normality(pd.Series(all_rest_times))
-
-        paired_differences = [r['difference'] for r in results]
-
-        if len(paired_differences) > 1:
-            if graphql_normal and rest_normal:
-                t_stat, p_value = ttest_rel(
-                    [r['graphql_mean'] for r in results],
-                    [r['rest_mean'] for r in results]
-                )
-                test_name = "Teste t pareado"
-            else:
-                t_stat, p_value = wilcoxon(
-                    [r['graphql_mean'] for r in results],
-                    [r['rest_mean'] for r in results],
-                    alternative='two-sided'
-                )
-                test_name = "Teste de Wilcoxon"
-
-            mean_diff = np.mean(paired_differences)
-            std_diff = np.std(paired_differences)
-            cohens_d = mean_diff / std_diff if std_diff > 0 else 0
-
-            if p_value < 0.05:
-                if mean_diff < 0:
-                    conclusion = "GraphQL é significativamente mais rápido que REST"
-                else:
-                    conclusion = "REST é significativamente mais rápido que GraphQL"
-            else:
-                conclusion = "Não há diferença significativa entre GraphQL e REST"
-        else:
-            p_value = 1.0
-            conclusion = "Dados insuficientes"
-            cohens_d = 0.0
-            test_name = 'N/A'
-
-        return {
-            'graphql_stats': graphql_stats,
-            'rest_stats': rest_stats,
-            'test_name': test_name,
-            'p_value': p_value,
-            'cohens_d': cohens_d,
-            'conclusion': conclusion,
-            'graphql_normal': graphql_normal,
-            'rest_normal': rest_normal,
-            'graphql_p': graphql_p,
-            'rest_p': rest_p
-        }
-
-    def analyze_rq2(self):
-        """Analisa RQ2: Tamanho da Resposta"""
-        results = []
-
-        for (repo_owner, repo_name, query_type), group in self.df.groupby(['repository_owner', 'repository_name', 'query_type']):
-            graphql_sizes = group[group['api_type'] == 'graphql']['response_size_bytes'].values
-            rest_sizes = group[group['api_type'] == 'rest']['response_size_bytes'].values
-
-            if len(graphql_sizes) > 0 and len(rest_sizes) > 0:
-                results.append({
-                    'repository': f"{repo_owner}/{repo_name}",
-                    'query_type': query_type,
-                    'graphql_mean': np.mean(graphql_sizes),
-                    'rest_mean': np.mean(rest_sizes),
-                    'difference': np.mean(graphql_sizes) - np.mean(rest_sizes)
-                })
-
-        all_graphql_sizes = self.df[self.df['api_type'] == 'graphql']['response_size_bytes'].values
-        all_rest_sizes = self.df[self.df['api_type'] == 'rest']['response_size_bytes'].values
-
-        graphql_stats = {
-            'mean': np.mean(all_graphql_sizes),
-            'median': np.median(all_graphql_sizes),
-            'std': np.std(all_graphql_sizes),
-            'min': np.min(all_graphql_sizes),
-            'max': np.max(all_graphql_sizes),
-            'count': len(all_graphql_sizes)
-        }
-
-        rest_stats = {
-            'mean': np.mean(all_rest_sizes),
-            'median': np.median(all_rest_sizes),
-            'std': np.std(all_rest_sizes),
-            'min': np.min(all_rest_sizes),
-            'max': np.max(all_rest_sizes),
-            'count': len(all_rest_sizes)
-        }
-
-        graphql_normal, graphql_p = self.test_normality(pd.Series(all_graphql_sizes))
-        rest_normal, rest_p = self.test_normality(pd.Series(all_rest_sizes))
-
-        paired_differences = [r['difference'] for r in results]
-
-        if len(paired_differences) > 1:
-            if graphql_normal and rest_normal:
-                t_stat, p_value = ttest_rel(
-                    [r['graphql_mean'] for r in results],
-                    [r['rest_mean'] for r in results]
-                )
-                test_name = "Teste t pareado"
-            else:
-                t_stat, p_value = wilcoxon(
-                    [r['graphql_mean'] for r in results],
-                    [r['rest_mean'] for r in results],
-                    alternative='two-sided'
-                )
-                test_name = "Teste de Wilcoxon"
-
-            mean_diff = np.mean(paired_differences)
-            std_diff = np.std(paired_differences)
-            cohens_d = mean_diff / std_diff if std_diff > 0 else 0
-
-            if p_value < 0.05:
-                if mean_diff < 0:
-                    conclusion = "GraphQL produz respostas significativamente menores que REST"
-                else:
-                    conclusion = "REST produz respostas significativamente menores que GraphQL"
-            else:
-                conclusion = "Não há diferença significativa entre GraphQL e REST"
-        else:
-            p_value = 1.0
-            conclusion = "Dados insuficientes"
-            cohens_d = 0.0
-            test_name = 'N/A'
-
-        return {
-            'graphql_stats': graphql_stats,
-            'rest_stats': rest_stats,
-            'test_name': test_name,
-            'p_value': p_value,
-            'cohens_d': cohens_d,
-            'conclusion': conclusion,
-            'graphql_normal': graphql_normal,
-            'rest_normal': rest_normal,
-            'graphql_p': graphql_p,
-            'rest_p': rest_p
-        }
-
-    def analyze_by_query_type(self):
-        """Analisa resultados por tipo de consulta"""
-        results_by_type = {}
-
-        for query_type in ['simple', 'complex', 'multiple']:
-            type_data = self.df[self.df['query_type'] == query_type]
-
-            if len(type_data) > 0:
-                graphql_times = type_data[type_data['api_type'] == 'graphql']['response_time_ms'].values
-                rest_times = type_data[type_data['api_type'] == 'rest']['response_time_ms'].values
-
-                graphql_sizes = type_data[type_data['api_type'] == 'graphql']['response_size_bytes'].values
-                rest_sizes = type_data[type_data['api_type'] == 'rest']['response_size_bytes'].values
-
-                results_by_type[query_type] = {
-                    'graphql_time_mean': np.mean(graphql_times) if len(graphql_times) > 0 else 0,
-                    'rest_time_mean': np.mean(rest_times) if len(rest_times) > 0 else 0,
-                    'graphql_size_mean': np.mean(graphql_sizes) if len(graphql_sizes) > 0 else 0,
-                    'rest_size_mean': np.mean(rest_sizes) if len(rest_sizes) > 0 else 0,
-                }
-
-        return results_by_type
-
-    def generate_visualizations(self):
-        """Gera visualizações dos dados"""
-        try:
-            plt.style.use('seaborn-v0_8')
-        except:
-            plt.style.use('default')
-
-        plt.rcParams['font.family'] = ['DejaVu Sans']
-
-        # 1. Boxplot - Comparação de tempo de resposta
-        plt.figure(figsize=(10, 6))
-        graphql_times = self.df[self.df['api_type'] == 'graphql']['response_time_ms']
-        rest_times = self.df[self.df['api_type'] == 'rest']['response_time_ms']
-
-        plt.boxplot([graphql_times, rest_times], labels=['GraphQL', 'REST'])
-        plt.title('Comparação de Tempo de Resposta: GraphQL vs REST', fontsize=14, fontweight='bold')
-        plt.ylabel('Tempo de Resposta (ms)')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        plt.savefig('grafico_tempo_resposta.png', dpi=300, bbox_inches='tight')
-        plt.close()
-
-        # 2. Boxplot - Comparação de tamanho de resposta
-        plt.figure(figsize=(10, 6))
-        graphql_sizes = self.df[self.df['api_type'] == 'graphql']['response_size_bytes']
-        rest_sizes = self.df[self.df['api_type'] == 'rest']['response_size_bytes']
-
-        plt.boxplot([graphql_sizes, rest_sizes], labels=['GraphQL', 'REST'])
-        plt.title('Comparação de Tamanho da Resposta: GraphQL vs REST', fontsize=14, fontweight='bold')
-        plt.ylabel('Tamanho da Resposta (bytes)')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        plt.savefig('grafico_tamanho_resposta.png', dpi=300, bbox_inches='tight')
-        plt.close()
-
-        # 3. Gráfico de barras - Comparação por tipo de consulta
-        by_type = self.analyze_by_query_type()
-
-        fig, axes = plt.subplots(1, 2, figsize=(15, 6))
-
-        query_types = list(by_type.keys())
-        graphql_times_by_type = [by_type[qt]['graphql_time_mean'] for qt in query_types]
-        rest_times_by_type = [by_type[qt]['rest_time_mean'] for qt in query_types]
-
-        x = np.arange(len(query_types))
-        width = 0.35
-
-        axes[0].bar(x - width/2, graphql_times_by_type, width, label='GraphQL', color='skyblue')
-        axes[0].bar(x + width/2, rest_times_by_type, width, label='REST', color='lightcoral')
-        axes[0].set_xlabel('Tipo de Consulta')
-        axes[0].set_ylabel('Tempo Médio (ms)')
-        axes[0].set_title('Tempo de Resposta por Tipo de Consulta')
-        axes[0].set_xticks(x)
-        axes[0].set_xticklabels([qt.capitalize() for qt in query_types])
-        axes[0].legend()
-        axes[0].grid(True, alpha=0.3)
-
-        graphql_sizes_by_type = [by_type[qt]['graphql_size_mean'] for qt in query_types]
-        rest_sizes_by_type = [by_type[qt]['rest_size_mean'] for qt in query_types]
-
-        axes[1].bar(x - width/2, graphql_sizes_by_type, width, label='GraphQL', color='skyblue')
-        axes[1].bar(x + width/2, rest_sizes_by_type, width, label='REST', color='lightcoral')
-        axes[1].set_xlabel('Tipo de Consulta')
-        axes[1].set_ylabel('Tamanho Médio (bytes)')
-        axes[1].set_title('Tamanho da Resposta por Tipo de Consulta')
-        axes[1].set_xticks(x)
-        axes[1].set_xticklabels([qt.capitalize() for qt in query_types])
-        axes[1].legend()
-        axes[1].grid(True, alpha=0.3)
-
-        plt.tight_layout()
-        plt.savefig('grafico_por_tipo.png', dpi=300, bbox_inches='tight')
-        plt.close()
-
-        # 4. Histograma - Distribuição de tempo
-        fig, axes = plt.subplots(1, 2, figsize=(15, 6))
-
-        axes[0].hist(graphql_times, bins=30, alpha=0.7, color='skyblue', edgecolor='black', label='GraphQL')
-        axes[0].hist(rest_times, bins=30, alpha=0.7, color='lightcoral', edgecolor='black', label='REST')
-        axes[0].set_xlabel('Tempo de Resposta (ms)')
-        axes[0].set_ylabel('Frequência')
-        axes[0].set_title('Distribuição de Tempo de Resposta')
-        axes[0].legend()
-        axes[0].grid(True, alpha=0.3)
-
-        axes[1].hist(graphql_sizes, bins=30, alpha=0.7, color='skyblue', edgecolor='black', label='GraphQL')
-        axes[1].hist(rest_sizes, bins=30, alpha=0.7, color='lightcoral', edgecolor='black', label='REST')
-        axes[1].set_xlabel('Tamanho da Resposta (bytes)')
-        axes[1].set_ylabel('Frequência')
-        axes[1].set_title('Distribuição de Tamanho da Resposta')
-        axes[1].legend()
-        axes[1].grid(True, alpha=0.3)
-
-        plt.tight_layout()
-        plt.savefig('grafico_histogramas.png', dpi=300, bbox_inches='tight')
-        plt.close()
-
-        print("Visualizações geradas com sucesso!")
-
-    def image_to_base64(self, image_path):
-        """Converte imagem para base64 para embedding"""
-        try:
-            with open(image_path, 'rb') as img_file:
-                return base64.b64encode(img_file.read()).decode('utf-8')
-        except Exception as e:
-            return "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
-
-    def generate_markdown_report(self):
-        """Gera o relatório completo em Markdown"""
-        rq1_results = self.analyze_rq1()
-        rq2_results = self.analyze_rq2()
-        by_type = self.analyze_by_query_type()
-
-        # Conta repositórios únicos
-        unique_repos = self.df[['repository_owner', 'repository_name']].drop_duplicates()
-        num_repos = len(unique_repos)
-
-        report = f"""# GraphQL vs REST - Um Experimento Controlado
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    CSV_ENGINE = 'pyarrow'
+except ImportError:  # pyarrow é opcional; sem ele usa o engine C
+    CSV_ENGINE = 'c'
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:  # brotli é opcional; só necessário para salvar o relatório como .md.br
+        brotli = None
+
+# Chave, nos metadados do cache Parquet, da identificação do CSV de origem
+# (caminho resolvido, tamanho e st_mtime_ns); o cache só é usado se ela coincidir
+CACHE_SOURCE_KEY = b'report_csv_source'
+# Versão do conteúdo do cache; incrementar quando _read_csv mudar colunas ou tipos
+CACHE_VERSION = 2
+
+# Tipos de consulta, na ordem em que aparecem no relatório e nos gráficos
+QUERY_TYPES = ['simple', 'complex', 'multiple']
+
+# Acima deste N o Shapiro-Wilk é trocado por D'Agostino-Pearson
+SHAPIRO_MAX_N = 5000
+
+# Apenas as colunas usadas no relatório, com tipos explícitos. Chaves de baixa cardinalidade como
+# category (comparações e groupby usam códigos inteiros); métricas em float32, pois as medições
+# com falha têm campos vazios (NaN) até o filtro de success
+CSV_DTYPES = {
+    'api_type': 'category',
+    'query_type': 'category',
+    'repository_owner': 'category',
+    'repository_name': 'category',
+    'success': 'bool',
+}
+# Métricas convertidas após a leitura com to_numeric(errors='coerce'): uma célula malformada vira
+# NaN em vez de abortar a carga, e os tempos ficam em float64 (float32 altera as medianas publicadas)
+METRIC_COLUMNS = ['response_time_ms', 'response_size_bytes']
+
+# Limites de |d| e rótulos do tamanho do efeito; side='right' mantém |d| < limite como na faixa inferior
+_EFFECT_BINS = np.array([0.2, 0.5, 0.8])
+_EFFECT_LABELS = ('muito pequeno', 'pequeno', 'médio', 'grande')
+
+# Resolução dos PNGs embutidos no relatório; o layout é resolvido por constrained_layout
+# na criação da figura, sem a segunda renderização de bbox_inches='tight'
+FIGURE_DPI = 150
+# Codificação PNG via Pillow com otimização da compressão (arquivos menores, mesma imagem)
+PNG_SAVE_OPTIONS = {'optimize': True}
+
+DESCRIBE_STATS = ['mean', 'median', 'std', 'min', 'max', 'count']
+
+
+def _describe(values: pd.Series) -> dict:
+    """Estatísticas descritivas em uma única chamada .agg"""
+    desc = values.agg(DESCRIBE_STATS).to_dict()
+    n = int(desc['count'])
+    # .agg usa std amostral (ddof=1); o relatório apresenta o desvio populacional (ddof=0)
+    desc['std'] = desc['std'] * np.sqrt((n - 1) / n) if n > 1 else 0.0
+    desc['count'] = n
+    return desc
+
+
+def _setup_plot_style():
+    """Estilo dos gráficos, aplicado em cada processo do pool"""
+    try:
+        plt.style.use('seaborn-v0_8')
+    except:
+        plt.style.use('default')
+
+    plt.rcParams['font.family'] = ['DejaVu Sans']
+
+
+def _render(plot):
+    """Executa uma função de plotagem (parcial) em um processo do pool"""
+    return plot()
+
+
+def _save_figure(out_path):
+    """
+    Rasteriza a figura atual uma vez em memória e devolve o PNG em base64 (embutido no relatório);
+    grava o mesmo conteúdo em out_path, se informado
+    """
+    fig = plt.gcf()
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=FIGURE_DPI, pil_kwargs=PNG_SAVE_OPTIONS)
+    plt.close(fig)
+    png = buf.getvalue()
+    if out_path:
+        with open(out_path, 'wb') as f:
+            f.write(png)
+    return base64.b64encode(png).decode('ascii')
+
+
+def _plot_boxplot(graphql_values, rest_values, title, ylabel, out_path):
+    """Boxplot GraphQL vs REST de uma métrica"""
+    plt.figure(figsize=(10, 6), constrained_layout=True)
+    plt.boxplot([graphql_values, rest_values], labels=['GraphQL', 'REST'])
+    plt.title(title, fontsize=14, fontweight='bold')
+    plt.ylabel(ylabel)
+    plt.grid(True, alpha=0.3)
+    return _save_figure(out_path)
+
+
+def _plot_by_query_type(by_type, out_path):
+    """Barras de tempo e tamanho médios por tipo de consulta"""
+    fig, axes = plt.subplots(1, 2, figsize=(15, 6), constrained_layout=True)
+
+    query_types = list(by_type.keys())
+    graphql_times_by_type = [by_type[qt]['graphql_time_mean'] for qt in query_types]
+    rest_times_by_type = [by_type[qt]['rest_time_mean'] for qt in query_types]
+
+    x = np.arange(len(query_types))
+    width = 0.35
+
+    axes[0].bar(x - width/2, graphql_times_by_type, width, label='GraphQL', color='skyblue')
+    axes[0].bar(x + width/2, rest_times_by_type, width, label='REST', color='lightcoral')
+    axes[0].set_xlabel('Tipo de Consulta')
+    axes[0].set_ylabel('Tempo Médio (ms)')
+    axes[0].set_title('Tempo de Resposta por Tipo de Consulta')
+    axes[0].set_xticks(x)
+    axes[0].set_xticklabels([qt.capitalize() for qt in query_types])
+    axes[0].legend()
+    axes[0].grid(True, alpha=0.3)
+
+    graphql_sizes_by_type = [by_type[qt]['graphql_size_mean'] for qt in query_types]
+    rest_sizes_by_type = [by_type[qt]['rest_size_mean'] for qt in query_types]
+
+    axes[1].bar(x - width/2, graphql_sizes_by_type, width, label='GraphQL', color='skyblue')
+    axes[1].bar(x + width/2, rest_sizes_by_type, width, label='REST', color='lightcoral')
+    axes[1].set_xlabel('Tipo de Consulta')
+    axes[1].set_ylabel('Tamanho Médio (bytes)')
+    axes[1].set_title('Tamanho da Resposta por Tipo de Consulta')
+    axes[1].set_xticks(x)
+    axes[1].set_xticklabels([qt.capitalize() for qt in query_types])
+    axes[1].legend()
+    axes[1].grid(True, alpha=0.3)
+
+    return _save_figure(out_path)
+
+
+def _shared_bin_edges(graphql_values, rest_values, bins=30):
+    """Faixas comuns às duas APIs, calculadas só com valores finitos (métricas vazias viram NaN)"""
+    values = np.concatenate([graphql_values, rest_values])
+    return np.histogram_bin_edges(values[np.isfinite(values)], bins=bins)
+
+
+def _plot_histograms(graphql_times, rest_times, graphql_sizes, rest_sizes, out_path):
+    """Histogramas de tempo e tamanho, GraphQL sobreposto a REST"""
+    # Mesmas faixas para as duas APIs: as barras sobrepostas ficam comparáveis
+    time_edges = _shared_bin_edges(graphql_times, rest_times)
+    size_edges = _shared_bin_edges(graphql_sizes, rest_sizes)
+
+    fig, axes = plt.subplots(1, 2, figsize=(15, 6), constrained_layout=True)
+
+    axes[0].hist(graphql_times, bins=time_edges, alpha=0.7, color='skyblue', edgecolor='black', label='GraphQL')
+    axes[0].hist(rest_times, bins=time_edges, alpha=0.7, color='lightcoral', edgecolor='black', label='REST')
+    axes[0].set_xlabel('Tempo de Resposta (ms)')
+    axes[0].set_ylabel('Frequência')
+    axes[0].set_title('Distribuição de Tempo de Resposta')
+    axes[0].legend()
+    axes[0].grid(True, alpha=0.3)
+
+    axes[1].hist(graphql_sizes, bins=size_edges, alpha=0.7, color='skyblue', edgecolor='black', label='GraphQL')
+    axes[1].hist(rest_sizes, bins=size_edges, alpha=0.7, color='lightcoral', edgecolor='black', label='REST')
+    axes[1].set_xlabel('Tamanho da Resposta (bytes)')
+    axes[1].set_ylabel('Frequência')
+    axes[1].set_title('Distribuição de Tamanho da Resposta')
+    axes[1].legend()
+    axes[1].grid(True, alpha=0.3)
+
+    return _save_figure(out_path)
+
+
+def _effect_label(cohens_d):
+    """Classificação do tamanho do efeito por |d| (limites de Cohen: 0.2, 0.5, 0.8)"""
+    return _EFFECT_LABELS[np.searchsorted(_EFFECT_BINS, abs(cohens_d), side='right')]
+
+
+def _report_fields(results):
+    """Resultados de uma RQ acrescidos dos valores derivados usados no modelo do relatório"""
+    graphql_mean = results['graphql_stats']['mean']
+    rest_mean = results['rest_stats']['mean']
+    mean_diff = graphql_mean - rest_mean
+
+    fields = dict(results)
+    fields.update(
+        graphql_normal_label='Normal' if results['graphql_normal'] else 'Não Normal',
+        rest_normal_label='Normal' if results['rest_normal'] else 'Não Normal',
+        normality_test_name=('Teste t pareado' if results['graphql_normal'] and results['rest_normal']
+                             else 'Teste de Wilcoxon'),
+        decision=('rejeitamos a hipótese nula (p < 0.05)' if results['p_value'] < 0.05
+                  else 'não rejeitamos a hipótese nula (p ≥ 0.05)'),
+        effect=_effect_label(results['cohens_d']),
+        # Formatados uma vez; p e d aparecem em várias seções do relatório
+        p_value_str=f"{results['p_value']:.4f}",
+        cohens_d_str=f"{results['cohens_d']:.4f}",
+        mean_diff=mean_diff,
+        abs_diff=abs(mean_diff),
+        abs_diff_kb=abs(mean_diff) / 1024,
+        pct_diff=abs(mean_diff / rest_mean * 100),
+    )
+    for side in ('graphql_stats', 'rest_stats'):
+        summary = results[side]
+        fields[side] = {**summary, 'mean_kb': summary['mean'] / 1024, 'median_kb': summary['median'] / 1024}
+    return fields
+
+
+# Modelo do relatório: preenchido com um único str.format em generate_markdown_report
+# (chaves literais escapadas como {{ }})
+REPORT_TEMPLATE = """# GraphQL vs REST - Um Experimento Controlado
 
 ## 1. Informações do Grupo
 
@@ -392,7 +253,7 @@ A linguagem de consulta GraphQL, proposta pelo Facebook como metodologia de impl
 
 Desde o seu surgimento, vários sistemas realizaram a migração entre ambas as soluções, mantendo soluções compatíveis REST, mas oferecendo os benefícios da nova linguagem de consulta proposta. Entretanto, não está claro quais os reais benefícios da adoção de uma API GraphQL em detrimento de uma API REST.
 
-Nesse contexto, o objetivo deste laboratório é realizar um experimento controlado para avaliar quantitativamente os benefícios da adoção de uma API GraphQL. Foram analisados **{len(self.df)} medições** em **{num_repos} repositórios** do GitHub, comparando as APIs GraphQL e REST em termos de tempo de resposta e tamanho das respostas.
+Nesse contexto, o objetivo deste laboratório é realizar um experimento controlado para avaliar quantitativamente os benefícios da adoção de uma API GraphQL. Foram analisados **{n_rows} medições** em **{num_repos} repositórios** do GitHub, comparando as APIs GraphQL e REST em termos de tempo de resposta e tamanho das respostas.
 
 ### 2.1 Questões de Pesquisa
 
@@ -420,8 +281,8 @@ Este experimento busca responder as seguintes perguntas:
 
 #### B. Variáveis Dependentes
 
-1. **Tempo de Resposta (ms):** Tempo decorrido desde o envio da requisição até o recebimento completo da resposta.
-2. **Tamanho da Resposta (bytes):** Tamanho total da resposta HTTP recebida, incluindo headers e body.
+1. **Tempo de Resposta (ms):** Tempo decorrido desde o envio da requisição até o recebimento completo da resposta. Na consulta com múltiplos recursos via REST, que exige uma requisição por repositório, as requisições são disparadas simultaneamente e o tempo registrado é o de parede do lote (do envio da primeira ao recebimento da última, ≈ máx. tᵢ), e não a soma Σtᵢ dos tempos individuais; o tamanho é a soma dos tamanhos das respostas.
+2. **Tamanho da Resposta (bytes):** Tamanho total da resposta HTTP recebida, incluindo headers e body (body medido já descomprimido, com `len(response.content)`, para todas as respostas).
 
 #### C. Variáveis Independentes
 
@@ -462,7 +323,7 @@ O objeto dessa pesquisa é comparar a eficiência entre as APIs GraphQL e REST d
 - **Número de repositórios:** {num_repos} repositórios
 - **Número de tipos de consulta:** 3 (simples, complexa, múltiplos recursos)
 - **Número de réplicas por consulta:** 30 execuções
-- **Total de medições realizadas:** {len(self.df)} medições bem-sucedidas
+- **Total de medições realizadas:** {n_rows} medições bem-sucedidas
 
 #### H. Ameaças à Validade
 
@@ -493,7 +354,7 @@ O objeto dessa pesquisa é comparar a eficiência entre as APIs GraphQL e REST d
 - **Bibliotecas:** requests, pandas, numpy, scipy, matplotlib, seaborn
 - **Rede:** Conexão estável à internet
 - **API:** GitHub API v4 (GraphQL) e v3 (REST)
-- **Data da coleta:** {datetime.now().strftime('%d/%m/%Y')}
+- **Data da coleta:** {collect_date}
 
 ### 3.3 Procedimento de Coleta
 
@@ -508,12 +369,13 @@ O objeto dessa pesquisa é comparar a eficiência entre as APIs GraphQL e REST d
    - Medir tempo de resposta com `time.perf_counter()`
    - Medir tamanho da resposta (headers + body)
    - Registrar sucesso/falha da requisição
-3. Armazenar todos os dados em CSV para análise posterior
+3. Executar as requisições sequencialmente, uma por vez, na ordem randomizada dos tratamentos; a coleta paralela (`EXPERIMENT_TRIAL_WORKERS` > 1 ou vários tokens em `GITHUB_TOKENS`) é opcional e, como sobrepõe medições e afeta o tempo de resposta, deve ser informada quando utilizada
+4. Armazenar todos os dados em CSV para análise posterior
 
 ### 3.4 Análise Estatística
 
 - **Estatísticas descritivas:** Média, mediana, desvio padrão, mínimo e máximo
-- **Teste de normalidade:** Shapiro-Wilk (α = 0.05)
+- **Teste de normalidade:** Shapiro-Wilk (α = 0.05; D'Agostino-Pearson para N > 5000)
 - **Teste de comparação:**
   - Se dados normais: Teste t pareado
   - Se dados não normais: Teste de Wilcoxon
@@ -529,122 +391,105 @@ O objeto dessa pesquisa é comparar a eficiência entre as APIs GraphQL e REST d
 #### 4.1.1 Tempo de Resposta
 
 **GraphQL:**
-- Média: {rq1_results['graphql_stats']['mean']:.2f} ms
-- Mediana: {rq1_results['graphql_stats']['median']:.2f} ms
-- Desvio Padrão: {rq1_results['graphql_stats']['std']:.2f} ms
-- Mínimo: {rq1_results['graphql_stats']['min']:.2f} ms
-- Máximo: {rq1_results['graphql_stats']['max']:.2f} ms
-- N = {rq1_results['graphql_stats']['count']}
+- Média: {rq1[graphql_stats][mean]:.2f} ms
+- Mediana: {rq1[graphql_stats][median]:.2f} ms
+- Desvio Padrão: {rq1[graphql_stats][std]:.2f} ms
+- Mínimo: {rq1[graphql_stats][min]:.2f} ms
+- Máximo: {rq1[graphql_stats][max]:.2f} ms
+- N = {rq1[graphql_stats][count]}
 
 **REST:**
-- Média: {rq1_results['rest_stats']['mean']:.2f} ms
-- Mediana: {rq1_results['rest_stats']['median']:.2f} ms
-- Desvio Padrão: {rq1_results['rest_stats']['std']:.2f} ms
-- Mínimo: {rq1_results['rest_stats']['min']:.2f} ms
-- Máximo: {rq1_results['rest_stats']['max']:.2f} ms
-- N = {rq1_results['rest_stats']['count']}
+- Média: {rq1[rest_stats][mean]:.2f} ms
+- Mediana: {rq1[rest_stats][median]:.2f} ms
+- Desvio Padrão: {rq1[rest_stats][std]:.2f} ms
+- Mínimo: {rq1[rest_stats][min]:.2f} ms
+- Máximo: {rq1[rest_stats][max]:.2f} ms
+- N = {rq1[rest_stats][count]}
 
-**Diferença de médias:** {rq1_results['graphql_stats']['mean'] - rq1_results['rest_stats']['mean']:.2f} ms
+**Diferença de médias:** {rq1[mean_diff]:.2f} ms
 
 #### 4.1.2 Tamanho da Resposta
 
 **GraphQL:**
-- Média: {rq2_results['graphql_stats']['mean']:.0f} bytes ({rq2_results['graphql_stats']['mean']/1024:.2f} KB)
-- Mediana: {rq2_results['graphql_stats']['median']:.0f} bytes ({rq2_results['graphql_stats']['median']/1024:.2f} KB)
-- Desvio Padrão: {rq2_results['graphql_stats']['std']:.0f} bytes
-- Mínimo: {rq2_results['graphql_stats']['min']:.0f} bytes
-- Máximo: {rq2_results['graphql_stats']['max']:.0f} bytes
-- N = {rq2_results['graphql_stats']['count']}
+- Média: {rq2[graphql_stats][mean]:.0f} bytes ({rq2[graphql_stats][mean_kb]:.2f} KB)
+- Mediana: {rq2[graphql_stats][median]:.0f} bytes ({rq2[graphql_stats][median_kb]:.2f} KB)
+- Desvio Padrão: {rq2[graphql_stats][std]:.0f} bytes
+- Mínimo: {rq2[graphql_stats][min]:.0f} bytes
+- Máximo: {rq2[graphql_stats][max]:.0f} bytes
+- N = {rq2[graphql_stats][count]}
 
 **REST:**
-- Média: {rq2_results['rest_stats']['mean']:.0f} bytes ({rq2_results['rest_stats']['mean']/1024:.2f} KB)
-- Mediana: {rq2_results['rest_stats']['median']:.0f} bytes ({rq2_results['rest_stats']['median']/1024:.2f} KB)
-- Desvio Padrão: {rq2_results['rest_stats']['std']:.0f} bytes
-- Mínimo: {rq2_results['rest_stats']['min']:.0f} bytes
-- Máximo: {rq2_results['rest_stats']['max']:.0f} bytes
-- N = {rq2_results['rest_stats']['count']}
+- Média: {rq2[rest_stats][mean]:.0f} bytes ({rq2[rest_stats][mean_kb]:.2f} KB)
+- Mediana: {rq2[rest_stats][median]:.0f} bytes ({rq2[rest_stats][median_kb]:.2f} KB)
+- Desvio Padrão: {rq2[rest_stats][std]:.0f} bytes
+- Mínimo: {rq2[rest_stats][min]:.0f} bytes
+- Máximo: {rq2[rest_stats][max]:.0f} bytes
+- N = {rq2[rest_stats][count]}
 
-**Diferença de médias:** {rq2_results['graphql_stats']['mean'] - rq2_results['rest_stats']['mean']:.0f} bytes
+**Diferença de médias:** {rq2[mean_diff]:.0f} bytes
 
 ### 4.2 Análise por Tipo de Consulta
 
 | Tipo de Consulta | Tempo GraphQL (ms) | Tempo REST (ms) | Tamanho GraphQL (bytes) | Tamanho REST (bytes) |
-|------------------|-------------------|-----------------|------------------------|---------------------|"""
-
-        for query_type, data in by_type.items():
-            report += f"\n| {query_type.capitalize()} | {data['graphql_time_mean']:.2f} | {data['rest_time_mean']:.2f} | {data['graphql_size_mean']:.0f} | {data['rest_size_mean']:.0f} |"
-
-        report += f"""
+|------------------|-------------------|-----------------|------------------------|---------------------|{by_type_rows}
 
 ### 4.3 RQ1: Tempo de Resposta
 
 #### 4.3.1 Teste de Normalidade
 
-- **GraphQL:** {'Normal' if rq1_results['graphql_normal'] else 'Não Normal'} (p = {rq1_results['graphql_p']:.4f})
-- **REST:** {'Normal' if rq1_results['rest_normal'] else 'Não Normal'} (p = {rq1_results['rest_p']:.4f})
+- **GraphQL:** {rq1[graphql_normal_label]} (p = {rq1[graphql_p]:.4f})
+- **REST:** {rq1[rest_normal_label]} (p = {rq1[rest_p]:.4f})
 
 #### 4.3.2 Teste Estatístico
 
-**Teste utilizado:** {rq1_results['test_name']}
+**Teste utilizado:** {rq1[test_name]}
 
-- **p-value:** {rq1_results['p_value']:.4f}
-- **Cohen's d:** {rq1_results['cohens_d']:.4f}
-- **Conclusão:** {rq1_results['conclusion']}
+- **p-value:** {rq1[p_value_str]}
+- **Cohen's d:** {rq1[cohens_d_str]}
+- **Conclusão:** {rq1[conclusion]}
 
 #### 4.3.3 Interpretação
 
-Com base no teste estatístico ({'Teste t pareado' if rq1_results['graphql_normal'] and rq1_results['rest_normal'] else 'Teste de Wilcoxon'}), {
-    'rejeitamos a hipótese nula (p < 0.05)' if rq1_results['p_value'] < 0.05 else 'não rejeitamos a hipótese nula (p ≥ 0.05)'
-}. O tamanho do efeito (Cohen's d = {rq1_results['cohens_d']:.4f}) indica um efeito {
-    'muito pequeno' if abs(rq1_results['cohens_d']) < 0.2 else
-    'pequeno' if abs(rq1_results['cohens_d']) < 0.5 else
-    'médio' if abs(rq1_results['cohens_d']) < 0.8 else 'grande'
-}.
+Com base no teste estatístico ({rq1[normality_test_name]}), {rq1[decision]}. O tamanho do efeito (Cohen's d = {rq1[cohens_d_str]}) indica um efeito {rq1[effect]}.
 
-**Resposta à RQ1:** {rq1_results['conclusion']}
+**Resposta à RQ1:** {rq1[conclusion]}
 
 #### 4.3.4 Visualizações
 
-![Comparação de Tempo de Resposta](data:image/png;base64,{self.image_to_base64('grafico_tempo_resposta.png')})
+![Comparação de Tempo de Resposta](data:image/png;base64,{img_tempo})
 
 ### 4.4 RQ2: Tamanho da Resposta
 
 #### 4.4.1 Teste de Normalidade
 
-- **GraphQL:** {'Normal' if rq2_results['graphql_normal'] else 'Não Normal'} (p = {rq2_results['graphql_p']:.4f})
-- **REST:** {'Normal' if rq2_results['rest_normal'] else 'Não Normal'} (p = {rq2_results['rest_p']:.4f})
+- **GraphQL:** {rq2[graphql_normal_label]} (p = {rq2[graphql_p]:.4f})
+- **REST:** {rq2[rest_normal_label]} (p = {rq2[rest_p]:.4f})
 
 #### 4.4.2 Teste Estatístico
 
-**Teste utilizado:** {rq2_results['test_name']}
+**Teste utilizado:** {rq2[test_name]}
 
-- **p-value:** {rq2_results['p_value']:.4f}
-- **Cohen's d:** {rq2_results['cohens_d']:.4f}
-- **Conclusão:** {rq2_results['conclusion']}
+- **p-value:** {rq2[p_value_str]}
+- **Cohen's d:** {rq2[cohens_d_str]}
+- **Conclusão:** {rq2[conclusion]}
 
 #### 4.4.3 Interpretação
 
-Com base no teste estatístico ({'Teste t pareado' if rq2_results['graphql_normal'] and rq2_results['rest_normal'] else 'Teste de Wilcoxon'}), {
-    'rejeitamos a hipótese nula (p < 0.05)' if rq2_results['p_value'] < 0.05 else 'não rejeitamos a hipótese nula (p ≥ 0.05)'
-}. O tamanho do efeito (Cohen's d = {rq2_results['cohens_d']:.4f}) indica um efeito {
-    'muito pequeno' if abs(rq2_results['cohens_d']) < 0.2 else
-    'pequeno' if abs(rq2_results['cohens_d']) < 0.5 else
-    'médio' if abs(rq2_results['cohens_d']) < 0.8 else 'grande'
-}.
+Com base no teste estatístico ({rq2[normality_test_name]}), {rq2[decision]}. O tamanho do efeito (Cohen's d = {rq2[cohens_d_str]}) indica um efeito {rq2[effect]}.
 
-**Resposta à RQ2:** {rq2_results['conclusion']}
+**Resposta à RQ2:** {rq2[conclusion]}
 
 #### 4.4.4 Visualizações
 
-![Comparação de Tamanho da Resposta](data:image/png;base64,{self.image_to_base64('grafico_tamanho_resposta.png')})
+![Comparação de Tamanho da Resposta](data:image/png;base64,{img_tamanho})
 
 ### 4.5 Análise Comparativa por Tipo de Consulta
 
-![Comparação por Tipo de Consulta](data:image/png;base64,{self.image_to_base64('grafico_por_tipo.png')})
+![Comparação por Tipo de Consulta](data:image/png;base64,{img_por_tipo})
 
 ### 4.6 Distribuições
 
-![Histogramas de Distribuição](data:image/png;base64,{self.image_to_base64('grafico_histogramas.png')})
+![Histogramas de Distribuição](data:image/png;base64,{img_histogramas})
 
 ---
 
@@ -654,20 +499,20 @@ Com base no teste estatístico ({'Teste t pareado' if rq2_results['graphql_norma
 
 #### 5.1.1 Tempo de Resposta (RQ1)
 
-{rq1_results['conclusion']}. A diferença média observada foi de {abs(rq1_results['graphql_stats']['mean'] - rq1_results['rest_stats']['mean']):.2f} ms, com {'GraphQL sendo' if rq1_results['graphql_stats']['mean'] < rq1_results['rest_stats']['mean'] else 'REST sendo'} {abs((rq1_results['graphql_stats']['mean'] - rq1_results['rest_stats']['mean']) / rq1_results['rest_stats']['mean'] * 100):.1f}% {'mais rápido' if rq1_results['graphql_stats']['mean'] < rq1_results['rest_stats']['mean'] else 'mais lento'}.
+{rq1[conclusion]}. A diferença média observada foi de {rq1[abs_diff]:.2f} ms, com {rq1[leader]} {rq1[pct_diff]:.1f}% {rq1[direction]}.
 
 Possíveis explicações para esses resultados:
-- {'GraphQL permite otimizar queries e reduzir overhead de múltiplas requisições' if rq1_results['graphql_stats']['mean'] < rq1_results['rest_stats']['mean'] else 'REST pode ter vantagem de caching mais eficiente no servidor'}
-- {'A flexibilidade do GraphQL pode ter custo de processamento adicional no servidor' if rq1_results['graphql_stats']['mean'] > rq1_results['rest_stats']['mean'] else 'GraphQL permite buscar apenas os dados necessários, reduzindo processamento'}
+- {rq1[reason_1]}
+- {rq1[reason_2]}
 - Implementação específica da API do GitHub pode favorecer um dos modelos
 
 #### 5.1.2 Tamanho da Resposta (RQ2)
 
-{rq2_results['conclusion']}. A diferença média observada foi de {abs(rq2_results['graphql_stats']['mean'] - rq2_results['rest_stats']['mean']):.0f} bytes ({abs(rq2_results['graphql_stats']['mean'] - rq2_results['rest_stats']['mean'])/1024:.2f} KB), com {'GraphQL produzindo' if rq2_results['graphql_stats']['mean'] < rq2_results['rest_stats']['mean'] else 'REST produzindo'} {abs((rq2_results['graphql_stats']['mean'] - rq2_results['rest_stats']['mean']) / rq2_results['rest_stats']['mean'] * 100):.1f}% {'respostas menores' if rq2_results['graphql_stats']['mean'] < rq2_results['rest_stats']['mean'] else 'respostas maiores'}.
+{rq2[conclusion]}. A diferença média observada foi de {rq2[abs_diff]:.0f} bytes ({rq2[abs_diff_kb]:.2f} KB), com {rq2[leader]} {rq2[pct_diff]:.1f}% {rq2[direction]}.
 
 Possíveis explicações:
-- {'GraphQL permite selecionar apenas os campos necessários, reduzindo payload' if rq2_results['graphql_stats']['mean'] < rq2_results['rest_stats']['mean'] else 'REST pode retornar dados pré-processados mais compactos'}
-- {'APIs REST frequentemente retornam campos desnecessários (over-fetching)' if rq2_results['graphql_stats']['mean'] < rq2_results['rest_stats']['mean'] else 'GraphQL pode incluir overhead de metadados na resposta'}
+- {rq2[reason_1]}
+- {rq2[reason_2]}
 - Formato de serialização e compressão podem influenciar resultados
 
 #### 5.1.3 Variação por Tipo de Consulta
@@ -743,13 +588,13 @@ Este estudo possui várias limitações que devem ser consideradas:
 
 ### 6.1 Síntese dos Resultados
 
-Este experimento controlado comparou as APIs GraphQL e REST do GitHub em termos de tempo de resposta e tamanho das respostas. Com base em **{len(self.df)} medições** realizadas em **{num_repos} repositórios**, os principais achados foram:
+Este experimento controlado comparou as APIs GraphQL e REST do GitHub em termos de tempo de resposta e tamanho das respostas. Com base em **{n_rows} medições** realizadas em **{num_repos} repositórios**, os principais achados foram:
 
 **RQ1 - Tempo de Resposta:**
-{rq1_results['conclusion']} (p = {rq1_results['p_value']:.4f}, d = {rq1_results['cohens_d']:.4f})
+{rq1[conclusion]} (p = {rq1[p_value_str]}, d = {rq1[cohens_d_str]})
 
 **RQ2 - Tamanho da Resposta:**
-{rq2_results['conclusion']} (p = {rq2_results['p_value']:.4f}, d = {rq2_results['cohens_d']:.4f})
+{rq2[conclusion]} (p = {rq2[p_value_str]}, d = {rq2[cohens_d_str]})
 
 ### 6.2 Contribuições
 
@@ -836,9 +681,9 @@ Colunas:
 
 ### 8.3 Ambiente de Execução
 
-- **Data da coleta:** {datetime.now().strftime('%d/%m/%Y')}
-- **Hora da coleta:** {datetime.now().strftime('%H:%M:%S')}
-- **Total de medições:** {len(self.df)}
+- **Data da coleta:** {collect_date}
+- **Hora da coleta:** {collect_time}
+- **Total de medições:** {n_rows}
 - **Repositórios analisados:** {num_repos}
 
 ### 8.4 Código de Consultas
@@ -868,28 +713,407 @@ GET /repos/facebook/react
 
 ---
 
-*Relatório gerado automaticamente em {datetime.now().strftime('%d/%m/%Y às %H:%M:%S')}*
+*Relatório gerado automaticamente em {generated_at}*
 """
 
-        return report
+# O modelo dividido nas seções de nível 2; cada uma é formatada e gravada separadamente
+REPORT_SECTIONS = re.split(r'(?m)^(?=## )', REPORT_TEMPLATE)
+
+# Buffer de escrita do relatório (as seções com imagens base64 têm centenas de KB)
+REPORT_WRITE_BUFFER = 1 << 20
+
+# Tamanho dos blocos lidos ao calcular o hash das entradas do relatório
+HASH_BLOCK_SIZE = 1 << 20
+
+# Figuras gravadas por generate_visualizations; o relatório só é dado como atualizado se existirem
+REPORT_FIGURES = ('grafico_tempo_resposta.png', 'grafico_tamanho_resposta.png',
+                  'grafico_por_tipo.png', 'grafico_histogramas.png')
+
+# Níveis de compressão do relatório salvo como .md.gz / .md.br
+REPORT_GZIP_LEVEL = 6
+REPORT_BROTLI_QUALITY = 5
+
+
+class GraphQLvsRESTReportGenerator:
+    def __init__(self, csv_file="experiment_data.csv", csv_stat=None):
+        """
+        Inicializa o gerador de relatório
+
+        csv_stat: os.stat do CSV, se o chamador já o obteve (evita um novo stat em load_data)
+        """
+        self.csv_file = csv_file
+        self._csv_stat = csv_stat
+        # Cache Parquet ao lado do CSV (experiment_data.csv[.gz] -> experiment_data.parquet)
+        csv_path = Path(csv_file)
+        self._cache_file = csv_path.with_name(re.sub(r'(\.csv)?(\.gz)?$', '', csv_path.name) + '.parquet')
+        self.df = None
+        self.analysis_results = {}
+        # Recortes por api_type, refeitos a cada load_data
+        self._graphql = None
+        self._rest = None
+        self._paired = None
+        self._n_rows = 0
+        self._n_repos = 0
+        # PNGs (base64) produzidos por generate_visualizations
+        self.images = {}
+
+    def _read_csv(self):
+        """Lê o CSV e devolve apenas as medições bem-sucedidas, já com os tipos compactos"""
+        # Parser em C/Arrow com os tipos das chaves já na leitura (sem inferência);
+        # arquivos .csv.gz são descomprimidos pelo read_csv (compression='infer')
+        df = pd.read_csv(self.csv_file, engine=CSV_ENGINE, usecols=[*CSV_DTYPES, *METRIC_COLUMNS], dtype=CSV_DTYPES)
+        print(f"Dados carregados: {len(df)} medições")
+
+        # Filtra apenas medições bem-sucedidas; a máscara booleana já devolve um frame novo, e a
+        # atribuição abaixo troca a coluna inteira, então .copy() só duplicaria a memória
+        df = df[df['success'].to_numpy()]
+        print(f"Medições bem-sucedidas: {len(df)}")
+
+        # Sem as falhas (campos vazios), os tamanhos cabem no menor inteiro sem sinal
+        # (to_numeric só reduz se a conversão for exata, p.ex. sem NaN nem negativos)
+        df['response_time_ms'] = pd.to_numeric(df['response_time_ms'], errors='coerce')
+        df['response_size_bytes'] = pd.to_numeric(df['response_size_bytes'], errors='coerce', downcast='unsigned')
+        return df
+
+    def _csv_source(self):
+        """Identificação do CSV de origem: caminho resolvido, tamanho e st_mtime_ns (e a versão do cache)"""
+        st = self._csv_stat if self._csv_stat is not None else os.stat(self.csv_file)
+        return f"{CACHE_VERSION}|{Path(self.csv_file).resolve()}|{st.st_size}|{st.st_mtime_ns}".encode()
+
+    def _cache_is_fresh(self, source):
+        """Cache Parquet existe e foi gerado a partir deste CSV (mesmo caminho, tamanho e mtime)"""
+        try:
+            return (pq.read_schema(self._cache_file).metadata or {}).get(CACHE_SOURCE_KEY) == source
+        except (OSError, pa.ArrowException):
+            return False
+
+    def load_data(self):
+        """Carrega e processa os dados do CSV (ou do cache Parquet, se estiver atualizado)"""
+        try:
+            cache = self._cache_file
+            source = self._csv_source()
+            if CSV_ENGINE == 'pyarrow' and self._cache_is_fresh(source):
+                self.df = pd.read_parquet(cache)
+                print(f"Dados carregados do cache: {len(self.df)} medições bem-sucedidas")
+            else:
+                self.df = self._read_csv()
+                if CSV_ENGINE == 'pyarrow':
+                    try:
+                        table = pa.Table.from_pandas(self.df, preserve_index=False)
+                        table = table.replace_schema_metadata({**table.schema.metadata, CACHE_SOURCE_KEY: source})
+                        pq.write_table(table, cache, compression='zstd')
+                    except Exception as e:
+                        print(f"Aviso: não foi possível salvar o cache Parquet: {e}")
+
+            # Dados novos: descarta análises memorizadas
+            self.analysis_results = {}
+
+            # Contagens citadas no relatório (repositórios únicos por owner/name)
+            self._n_rows = len(self.df)
+            self._n_repos = len(self.df[['repository_owner', 'repository_name']].drop_duplicates())
+
+            # Médias por (repositório, tipo de consulta) com GraphQL e REST lado a lado, para as duas
+            # métricas em um único groupby (RQ1 lê o bloco de tempo, RQ2 o de tamanho)
+            self._paired = (self.df.groupby(['repository_owner', 'repository_name', 'query_type', 'api_type'],
+                                            sort=False, observed=True)[['response_time_ms', 'response_size_bytes']]
+                            .mean()
+                            .unstack('api_type'))
+
+            # Separa GraphQL/REST uma única vez; análises e gráficos reutilizam os recortes
+            by_api = dict(tuple(self.df.groupby('api_type', sort=False, observed=True)))
+            self._graphql = by_api.get('graphql', self.df.iloc[:0])
+            self._rest = by_api.get('rest', self.df.iloc[:0])
+
+            return True
+        except Exception as e:
+            print(f"Erro ao carregar dados: {e}")
+            return False
+
+    def test_normality(self, data: np.ndarray):
+        """
+        Testa normalidade dos dados usando Shapiro-Wilk
+
+        Acima de SHAPIRO_MAX_N o p-valor do Shapiro-Wilk não é confiável; usa D'Agostino-Pearson
+        (normaltest), que vale para amostras grandes e dispensa a subamostragem.
+        """
+        if data.size < 3:
+            return False, 1.0
+
+        test = shapiro if data.size <= SHAPIRO_MAX_N else normaltest
+
+        try:
+            stat, p_value = test(data)
+            is_normal = p_value > 0.05
+            return is_normal, p_value
+        except:
+            return False, 0.0
+
+    def _analyze_metric(self, metric, conclusions):
+        """
+        Teste pareado GraphQL vs REST para uma métrica (compartilhado por RQ1 e RQ2)
+
+        conclusions: (GraphQL melhor, REST melhor) quando a diferença é significativa
+        """
+        # Pares (repositório, tipo de consulta) com as duas APIs medidas
+        paired = self._paired[metric].reindex(columns=['graphql', 'rest']).dropna()
+        graphql_means = paired['graphql'].to_numpy()
+        rest_means = paired['rest'].to_numpy()
+        paired_differences = graphql_means - rest_means
+
+        all_graphql = self._graphql[metric]
+        all_rest = self._rest[metric]
+
+        graphql_stats = _describe(all_graphql)
+        rest_stats = _describe(all_rest)
+
+        graphql_normal, graphql_p = self.test_normality(all_graphql.to_numpy())
+        rest_normal, rest_p = self.test_normality(all_rest.to_numpy())
+
+        if paired_differences.size > 1:
+            if graphql_normal and rest_normal:
+                t_stat, p_value = ttest_rel(graphql_means, rest_means)
+                test_name = "Teste t pareado"
+            else:
+                t_stat, p_value = wilcoxon(graphql_means, rest_means, alternative='two-sided')
+                test_name = "Teste de Wilcoxon"
+
+            mean_diff = paired_differences.mean()
+            std_diff = paired_differences.std()
+            cohens_d = mean_diff / std_diff if std_diff > 0 else 0
+
+            if p_value < 0.05:
+                conclusion = conclusions[0] if mean_diff < 0 else conclusions[1]
+            else:
+                conclusion = "Não há diferença significativa entre GraphQL e REST"
+        else:
+            p_value = 1.0
+            conclusion = "Dados insuficientes"
+            cohens_d = 0.0
+            test_name = 'N/A'
+
+        return {
+            'graphql_stats': graphql_stats,
+            'rest_stats': rest_stats,
+            'test_name': test_name,
+            'p_value': p_value,
+            'cohens_d': cohens_d,
+            'conclusion': conclusion,
+            'graphql_normal': graphql_normal,
+            'rest_normal': rest_normal,
+            'graphql_p': graphql_p,
+            'rest_p': rest_p
+        }
+
+    def analyze_rq1(self):
+        """Analisa RQ1: Tempo de Resposta"""
+        if 'rq1' not in self.analysis_results:
+            self.analysis_results['rq1'] = self._analyze_metric('response_time_ms', (
+                "GraphQL é significativamente mais rápido que REST",
+                "REST é significativamente mais rápido que GraphQL"
+            ))
+        return self.analysis_results['rq1']
+
+    def analyze_rq2(self):
+        """Analisa RQ2: Tamanho da Resposta"""
+        if 'rq2' not in self.analysis_results:
+            self.analysis_results['rq2'] = self._analyze_metric('response_size_bytes', (
+                "GraphQL produz respostas significativamente menores que REST",
+                "REST produz respostas significativamente menores que GraphQL"
+            ))
+        return self.analysis_results['rq2']
+
+    def analyze_by_query_type(self):
+        """Analisa resultados por tipo de consulta"""
+        if 'by_type' in self.analysis_results:
+            return self.analysis_results['by_type']
+
+        # Médias de tempo e tamanho por (tipo de consulta, API) em um único groupby
+        means = (self.df.groupby(['query_type', 'api_type'], observed=True)[['response_time_ms', 'response_size_bytes']]
+                 .mean()
+                 .unstack('api_type'))
+        columns = {
+            'graphql_time_mean': ('response_time_ms', 'graphql'),
+            'rest_time_mean': ('response_time_ms', 'rest'),
+            'graphql_size_mean': ('response_size_bytes', 'graphql'),
+            'rest_size_mean': ('response_size_bytes', 'rest'),
+        }
+        means = means.reindex(index=[qt for qt in QUERY_TYPES if qt in means.index],
+                              columns=list(columns.values())).fillna(0)
+        means.columns = list(columns)
+
+        self.analysis_results['by_type'] = means.to_dict('index')
+        return self.analysis_results['by_type']
+
+    def generate_visualizations(self, save_png=True):
+        """
+        Gera visualizações dos dados
+
+        Returns:
+            dict: nome do arquivo -> PNG em base64, embutido diretamente no relatório
+            (os arquivos .png só são gravados com save_png=True)
+        """
+        by_type = self.analyze_by_query_type()
+        # Arrays NumPy: sem índice a serializar para o pool nem conversão dentro do matplotlib
+        graphql_times = self._graphql['response_time_ms'].to_numpy()
+        rest_times = self._rest['response_time_ms'].to_numpy()
+        graphql_sizes = self._graphql['response_size_bytes'].to_numpy()
+        rest_sizes = self._rest['response_size_bytes'].to_numpy()
+
+        # Gráficos independentes: cada um é rasterizado em um processo, recebendo só as colunas que usa
+        plots = {
+            'grafico_tempo_resposta.png': partial(
+                _plot_boxplot, graphql_times, rest_times,
+                'Comparação de Tempo de Resposta: GraphQL vs REST', 'Tempo de Resposta (ms)'),
+            'grafico_tamanho_resposta.png': partial(
+                _plot_boxplot, graphql_sizes, rest_sizes,
+                'Comparação de Tamanho da Resposta: GraphQL vs REST', 'Tamanho da Resposta (bytes)'),
+            'grafico_por_tipo.png': partial(_plot_by_query_type, by_type),
+            'grafico_histogramas.png': partial(_plot_histograms, graphql_times, rest_times, graphql_sizes, rest_sizes),
+        }
+        with ProcessPoolExecutor(max_workers=len(plots), initializer=_setup_plot_style) as executor:
+            images = executor.map(_render, [partial(plot, name if save_png else None) for name, plot in plots.items()])
+            self.images = dict(zip(plots, images))
+
+        print("Visualizações geradas com sucesso!")
+        return self.images
+
+    def image_to_base64(self, image_path):
+        """Converte imagem para base64 para embedding"""
+        try:
+            with open(image_path, 'rb') as img_file:
+                return base64.b64encode(img_file.read()).decode('utf-8')
+        except Exception as e:
+            return "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+
+    def _image(self, image_path):
+        """PNG em base64 já gerado em memória; senão lê o arquivo"""
+        return self.images.get(image_path) or self.image_to_base64(image_path)
+
+    def _report_context(self):
+        """Valores que preenchem o modelo do relatório"""
+        rq1 = _report_fields(self.analyze_rq1())
+        rq2 = _report_fields(self.analyze_rq2())
+        by_type = self.analyze_by_query_type()
+
+        # Textos da discussão que dependem de qual API teve a menor média
+        graphql_faster = rq1['graphql_stats']['mean'] < rq1['rest_stats']['mean']
+        rq1.update(
+            leader='GraphQL sendo' if graphql_faster else 'REST sendo',
+            direction='mais rápido' if graphql_faster else 'mais lento',
+            reason_1=('GraphQL permite otimizar queries e reduzir overhead de múltiplas requisições' if graphql_faster
+                      else 'REST pode ter vantagem de caching mais eficiente no servidor'),
+            reason_2=('A flexibilidade do GraphQL pode ter custo de processamento adicional no servidor'
+                      if rq1['graphql_stats']['mean'] > rq1['rest_stats']['mean']
+                      else 'GraphQL permite buscar apenas os dados necessários, reduzindo processamento'),
+        )
+        graphql_smaller = rq2['graphql_stats']['mean'] < rq2['rest_stats']['mean']
+        rq2.update(
+            leader='GraphQL produzindo' if graphql_smaller else 'REST produzindo',
+            direction='respostas menores' if graphql_smaller else 'respostas maiores',
+            reason_1=('GraphQL permite selecionar apenas os campos necessários, reduzindo payload' if graphql_smaller
+                      else 'REST pode retornar dados pré-processados mais compactos'),
+            reason_2=('APIs REST frequentemente retornam campos desnecessários (over-fetching)' if graphql_smaller
+                      else 'GraphQL pode incluir overhead de metadados na resposta'),
+        )
+
+        by_type_rows = ''.join(
+            f"\n| {query_type.capitalize()} | {data['graphql_time_mean']:.2f} | {data['rest_time_mean']:.2f} | {data['graphql_size_mean']:.0f} | {data['rest_size_mean']:.0f} |"
+            for query_type, data in by_type.items()
+        )
+
+        # Um único instante para todas as datas/horas do relatório (consistentes entre si)
+        now = datetime.now()
+
+        # As imagens entram como valores do format (base64 não tem chaves)
+        return dict(
+            rq1=rq1,
+            rq2=rq2,
+            by_type_rows=by_type_rows,
+            n_rows=self._n_rows,
+            num_repos=self._n_repos,
+            collect_date=now.strftime('%d/%m/%Y'),
+            collect_time=now.strftime('%H:%M:%S'),
+            generated_at=now.strftime('%d/%m/%Y às %H:%M:%S'),
+            img_tempo=self._image('grafico_tempo_resposta.png'),
+            img_tamanho=self._image('grafico_tamanho_resposta.png'),
+            img_por_tipo=self._image('grafico_por_tipo.png'),
+            img_histogramas=self._image('grafico_histogramas.png'),
+        )
+
+    def iter_markdown_report(self):
+        """Gera o relatório em Markdown seção a seção (seções '## ' do modelo)"""
+        context = self._report_context()
+        for section in REPORT_SECTIONS:
+            yield section.format(**context)
+
+    def generate_markdown_report(self):
+        """Gera o relatório completo em Markdown"""
+        return ''.join(self.iter_markdown_report())
 
     def save_report(self, report_content, filename="relatorio_experimento_graphql_rest.md"):
-        """Salva o relatório em arquivo Markdown"""
+        """
+        Salva o relatório em arquivo Markdown
+
+        report_content pode ser o texto completo ou um iterável de seções (iter_markdown_report),
+        gravadas à medida que são geradas, sem montar o relatório inteiro em memória.
+        Nomes terminados em .gz ou .br gravam o relatório comprimido (gzip ou Brotli).
+        """
+        chunks = [report_content] if isinstance(report_content, str) else report_content
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(report_content)
+            if filename.endswith('.br'):
+                if brotli is None:
+                    raise RuntimeError("pacote brotli (ou brotlicffi) não instalado")
+                # Compressão incremental: cada seção é comprimida assim que gerada
+                compressor = brotli.Compressor(quality=REPORT_BROTLI_QUALITY)
+                with open(filename, 'wb', buffering=REPORT_WRITE_BUFFER) as f:
+                    for chunk in chunks:
+                        f.write(compressor.process(chunk.encode('utf-8')))
+                    f.write(compressor.finish())
+            elif filename.endswith('.gz'):
+                with gzip.open(filename, 'wt', encoding='utf-8', compresslevel=REPORT_GZIP_LEVEL) as f:
+                    f.writelines(chunks)
+            else:
+                with open(filename, 'w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER) as f:
+                    f.writelines(chunks)
             print(f"\nRelatório salvo em: {filename}")
             return True
         except Exception as e:
             print(f"Erro ao salvar relatório: {e}")
             return False
 
-    def generate_complete_report(self):
-        """Gera o relatório completo com visualizações"""
+    def _input_digest(self):
+        """Hash do CSV e do código deste script: muda sempre que o relatório gerado mudaria"""
+        h = hashlib.blake2b(digest_size=16)
+        for path in (self.csv_file, __file__):
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+                    h.update(block)
+        return h.hexdigest()
+
+    def generate_complete_report(self, filename="relatorio_experimento_graphql_rest.md", force=False):
+        """
+        Gera o relatório completo com visualizações
+
+        Se o CSV e este script não mudaram desde a última geração (hash gravado em <filename>.hash)
+        e o relatório e as figuras ainda existem, nada é refeito; force=True regenera mesmo assim.
+
+        Returns:
+            bool: True se o relatório está atualizado (gerado agora ou já existente), False em erro.
+            Quando nada é refeito, os dados não são carregados: df, analysis_results e images
+            permanecem vazios (chame load_data/analyze_* se precisar deles).
+        """
         print("="*60)
         print("GERADOR DE RELATÓRIO - EXPERIMENTO GRAPHQL VS REST")
         print("="*60)
 
+        hash_file = Path(filename + '.hash')
+        digest = self._input_digest()
+        outputs = (filename, *REPORT_FIGURES)
+        if (not force and hash_file.exists() and all(Path(p).exists() for p in outputs)
+                and hash_file.read_text().strip() == digest):
+            print(f"\nRelatório {filename} já está atualizado (dados e script inalterados); nada a fazer.")
+            return True
+
         print("\n1. Carregando dados...")
         if not self.load_data():
             print("Erro ao carregar dados. Verifique se o arquivo experiment_data.csv existe.")
@@ -903,17 +1127,19 @@ GET /repos/facebook/react
         rq2 = self.analyze_rq2()
 
         print("\n4. Gerando relatório em Markdown...")
-        report_content = self.generate_markdown_report()
+        # Gerador de seções: cada uma é montada e gravada em sequência pelo save_report
+        report_content = self.iter_markdown_report()
 
         print("\n5. Salvando relatório...")
-        success = self.save_report(report_content)
+        success = self.save_report(report_content, filename)
 
         if success:
+            hash_file.write_text(digest)
             print("\n" + "="*60)
             print("RELATÓRIO GERADO COM SUCESSO!")
             print("="*60)
             print("\nArquivos criados:")
-            print("- relatorio_experimento_graphql_rest.md (Relatório completo)")
+            print(f"- {filename} (Relatório completo)")
             print("- grafico_tempo_resposta.png (Comparação de tempo)")
             print("- grafico_tamanho_resposta.png (Comparação de tamanho)")
             print("- grafico_por_tipo.png (Análise por tipo de consulta)")
@@ -931,13 +1157,20 @@ GET /repos/facebook/react
 def main():
     """Função principal"""
     csv_file = "experiment_data.csv"
-
-    if not Path(csv_file).exists():
+    # Um único stat confirma que o arquivo existe e identifica o CSV para o cache Parquet;
+    # aceita também o CSV comprimido (read_csv infere a compressão pela extensão)
+    for candidate in (csv_file, csv_file + ".gz"):
+        try:
+            st = os.stat(candidate)
+            break
+        except FileNotFoundError:
+            continue
+    else:
         print(f"Erro: Arquivo {csv_file} não encontrado!")
         print("Execute primeiro o script experiment_collector.py para coletar os dados.")
         return
 
-    generator = GraphQLvsRESTReportGenerator(csv_file)
+    generator = GraphQLvsRESTReportGenerator(candidate, csv_stat=st)
     generator.generate_complete_report()
 
 